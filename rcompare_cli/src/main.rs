@@ -11,7 +11,7 @@ use rcompare_core::{
     JsonDiffEngine, ParquetDiffEngine, TextDiffEngine,
 };
 use serde::Serialize;
-use std::io::IsTerminal;
+use std::io::{IsTerminal, Write};
 use std::path::{Path, PathBuf};
 use std::time::{SystemTime, UNIX_EPOCH};
 use tracing::{error, info};
@@ -2114,8 +2114,12 @@ fn run_scan(
             json_yaml_diffs,
             json_parquet_diffs,
         );
-        let output = serde_json::to_string_pretty(&report)?;
-        println!("{output}");
+        // Stream the report instead of formatting it into one String first,
+        // so the reader can consume output while the rest is serialized.
+        let mut out = std::io::BufWriter::new(std::io::stdout().lock());
+        serde_json::to_writer_pretty(&mut out, &report)?;
+        writeln!(out)?;
+        out.flush()?;
     }
 
     // Calculate final statistics for exit code
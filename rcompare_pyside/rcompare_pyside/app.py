@@ -2,6 +2,7 @@
 
 import sys
 
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 
 from .dialogs.splash_dialog import SplashDialog
@@ -9,6 +10,7 @@ from .main_window import MainWindow
 from .utils.config import AppConfig
 from .resources.themes import load_light_theme, load_dark_theme
 from .utils.telemetry import configure_telemetry, log_exception, log_info
+from .views.image_view import PIXMAP_CACHE_LIMIT_KB
 
 
 def main():
@@ -20,6 +22,7 @@ def main():
     app.setApplicationVersion("0.1.0")
     app.setOrganizationName("aecs4u")
     app.setStyle("Fusion")
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
 
     config = AppConfig.load()
     log_info("configuration loaded", theme=config.theme)
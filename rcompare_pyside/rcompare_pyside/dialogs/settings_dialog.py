@@ -52,6 +52,9 @@ class SettingsDialog(QDialog):
         self._hash_check = QCheckBox("Use hash verification for same-sized files")
         self._hash_check.setChecked(settings.use_hash_verification)
         options_layout.addRow(self._hash_check)
+        self._sample_stats_check = QCheckBox("Sample large images for pixel statistics")
+        self._sample_stats_check.setChecked(settings.sample_image_stats)
+        options_layout.addRow(self._sample_stats_check)
 
         cache_row = QHBoxLayout()
         self._cache_edit = QLineEdit(settings.cache_dir or "")
@@ -104,6 +107,7 @@ class SettingsDialog(QDialog):
             follow_symlinks=self._symlinks_check.isChecked(),
             use_hash_verification=self._hash_check.isChecked(),
             cache_dir=self._cache_edit.text() or None,
+            sample_image_stats=self._sample_stats_check.isChecked(),
         )
 
     def get_config_updates(self) -> dict:
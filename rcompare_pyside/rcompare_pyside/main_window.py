@@ -27,14 +27,14 @@ from PySide6.QtWidgets import (
 )
 
 from .utils.config import AppConfig
-from .utils.cli_bridge import CliBridge, DiffStatus, ScanReport
+from .utils.cli_bridge import CliBridge, DiffStatus, ScanOptions, ScanReport
 from .models.comparison import build_tree_with_options, TreeNode
 from .models.settings import ComparisonSettings, ProfileManager
 from .views.path_bar import PathBar
 from .views.folder_view import FolderView
 from .views.text_view import TextView
 from .views.hex_view import HexView
-from .views.image_view import ImageView
+from .views.image_view import IMAGE_EXTENSIONS, ImageView
 from .widgets.filter_bar import FilterBar
 from .workers.comparison_worker import ComparisonWorker
 from .dialogs.settings_dialog import SettingsDialog
@@ -53,11 +53,6 @@ TEXT_EXTENSIONS = {
     ".toml", ".ini", ".cfg", ".sql", ".csv", ".log",
 }
 
-IMAGE_EXTENSIONS = {
-    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".tif",
-    ".webp", ".ico", ".svg",
-}
-
 _AUTO_CLOSE_PROFILE_NAME = "Last Session (Auto)"
 _BASE_VIEW_TAB_COUNT = 4
 
@@ -736,6 +731,7 @@ class MainWindow(QMainWindow):
             follow_symlinks=self._settings.follow_symlinks,
             use_hash_verification=self._settings.use_hash_verification,
             cache_dir=self._settings.cache_dir,
+            sample_image_stats=self._settings.sample_image_stats,
         )
         session.three_way_mode = self._three_way_mode
         session.show_identical = self._filter_bar.show_identical
@@ -752,6 +748,13 @@ class MainWindow(QMainWindow):
         session.always_show_folders = self._act_always_show_folders.isChecked()
         self._update_active_session_title()
 
+    def _apply_stats_sampling(self) -> None:
+        """Push the image statistics sampling setting to every image view."""
+        for index in range(self._view_stack.count()):
+            view = self._view_stack.widget(index)
+            if isinstance(view, ImageView):
+                view.set_stats_sampling(self._settings.sample_image_stats)
+
     def _apply_session_state(self, idx: int) -> None:
         if idx < 0 or idx >= len(self._sessions):
             return
@@ -763,7 +766,9 @@ class MainWindow(QMainWindow):
             follow_symlinks=session.settings.follow_symlinks,
             use_hash_verification=session.settings.use_hash_verification,
             cache_dir=session.settings.cache_dir,
+            sample_image_stats=session.settings.sample_image_stats,
         )
+        self._apply_stats_sampling()
 
         self._path_bar.left_path = session.left_path
         self._path_bar.right_path = session.right_path
@@ -779,20 +784,29 @@ class MainWindow(QMainWindow):
         self._path_bar.set_three_way_mode(session.three_way_mode)
 
         self._filter_bar.blockSignals(True)
-        self._filter_bar.show_identical = session.show_identical
-        self._filter_bar.show_different = session.show_different
-        self._filter_bar.show_left_only = session.show_left_only
-        self._filter_bar.show_right_only = session.show_right_only
-        self._filter_bar.show_files_only = session.show_files_only
-        self._filter_bar.search_text = session.search_text
+        self._filter_bar.set_filters(
+            session.show_identical,
+            session.show_different,
+            session.show_left_only,
+            session.show_right_only,
+            session.show_files_only,
+            session.search_text,
+        )
         self._filter_bar.diff_option_mode = session.diff_option_mode
         self._filter_bar.blockSignals(False)
 
+        # The filter bar is already restored; don't let each checkbox sync
+        # back into it (and from there into the session) one at a time.
+        filter_actions = self._view_filter_actions()
+        for action in filter_actions:
+            action.blockSignals(True)
         self._act_show_identical.setChecked(session.show_identical)
         self._act_show_different.setChecked(session.show_different)
         self._act_show_left_only.setChecked(session.show_left_only)
         self._act_show_right_only.setChecked(session.show_right_only)
         self._act_show_files_only.setChecked(session.show_files_only)
+        for action in filter_actions:
+            action.blockSignals(False)
         self._folder_view.set_filters(
             session.show_identical,
             session.show_different,
@@ -900,17 +914,32 @@ class MainWindow(QMainWindow):
         self._folder_view.set_diff_option_mode(mode)
         self._current_session().diff_option_mode = mode
 
+    def _view_filter_actions(self) -> list[QAction]:
+        return [
+            self._act_show_identical,
+            self._act_show_different,
+            self._act_show_left_only,
+            self._act_show_right_only,
+            self._act_show_files_only,
+        ]
+
     @Slot()
     def _on_view_filter_toggled(self) -> None:
         """Sync the View menu filter checkboxes into the FilterBar."""
-        self._filter_bar.show_identical = self._act_show_identical.isChecked()
-        self._filter_bar.show_different = self._act_show_different.isChecked()
-        self._filter_bar.show_left_only = self._act_show_left_only.isChecked()
-        self._filter_bar.show_right_only = self._act_show_right_only.isChecked()
-        self._filter_bar.show_files_only = self._act_show_files_only.isChecked()
+        self._filter_bar.set_filters(
+            self._act_show_identical.isChecked(),
+            self._act_show_different.isChecked(),
+            self._act_show_left_only.isChecked(),
+            self._act_show_right_only.isChecked(),
+            self._act_show_files_only.isChecked(),
+        )
         self._update_quick_filter_actions()
 
     def _apply_quick_filter_preset(self, preset: str) -> None:
+        # Sync into the FilterBar once at the end, not per checkbox.
+        filter_actions = self._view_filter_actions()
+        for action in filter_actions:
+            action.blockSignals(True)
         if preset == "all":
             self._act_show_identical.setChecked(True)
             self._act_show_different.setChecked(True)
@@ -927,6 +956,8 @@ class MainWindow(QMainWindow):
             self._act_show_left_only.setChecked(False)
             self._act_show_right_only.setChecked(False)
         self._act_show_files_only.setChecked(self._filter_bar.show_files_only)
+        for action in filter_actions:
+            action.blockSignals(False)
         self._on_view_filter_toggled()
 
     def _update_quick_filter_actions(self) -> None:
@@ -1059,13 +1090,13 @@ class MainWindow(QMainWindow):
         self._current_session().status_summary = "Comparing..."
         self.statusBar().showMessage("Starting comparison...")
 
-        self._worker.start_scan(
+        self._worker.start_scan(ScanOptions(
             left=left,
             right=right,
             follow_symlinks=self._settings.follow_symlinks,
             verify_hashes=self._settings.use_hash_verification,
-            ignore_patterns=self._settings.ignore_patterns or None,
-        )
+            ignore_patterns=tuple(self._settings.ignore_patterns or ()),
+        ))
         log_info(
             "compare started",
             follow_symlinks=self._settings.follow_symlinks,
@@ -1261,6 +1292,7 @@ class MainWindow(QMainWindow):
             label = f"Text: {Path(path).name}"
         elif mode == "image":
             view = ImageView(self._view_stack)
+            view.set_stats_sampling(self._settings.sample_image_stats)
             view.compare_images(str(left_file), str(right_file))
             widget = view
             label = f"Image: {Path(path).name}"
@@ -2026,11 +2058,13 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             # Re-read settings that may have changed
             self._settings = dialog.get_settings()
+            self._apply_stats_sampling()
             self._current_session().settings = ComparisonSettings(
                 ignore_patterns=list(self._settings.ignore_patterns),
                 follow_symlinks=self._settings.follow_symlinks,
                 use_hash_verification=self._settings.use_hash_verification,
                 cache_dir=self._settings.cache_dir,
+                sample_image_stats=self._settings.sample_image_stats,
             )
             updates = dialog.get_config_updates()
             self._config.theme = str(updates.get("theme", self._config.theme))
@@ -2134,6 +2168,7 @@ class MainWindow(QMainWindow):
                     follow_symlinks=profile.follow_symlinks,
                     use_hash_verification=profile.hash_verification,
                     cache_dir=self._settings.cache_dir,
+                    sample_image_stats=self._settings.sample_image_stats,
                 )
                 session.report = None
                 session.status_summary = "Profile loaded"
@@ -2201,11 +2236,13 @@ class MainWindow(QMainWindow):
         dialog = SettingsDialog(self._config, self._settings, self)
         if dialog.exec():
             self._settings = dialog.get_settings()
+            self._apply_stats_sampling()
             self._current_session().settings = ComparisonSettings(
                 ignore_patterns=list(self._settings.ignore_patterns),
                 follow_symlinks=self._settings.follow_symlinks,
                 use_hash_verification=self._settings.use_hash_verification,
                 cache_dir=self._settings.cache_dir,
+                sample_image_stats=self._settings.sample_image_stats,
             )
 
     @Slot()
@@ -2302,6 +2339,7 @@ class MainWindow(QMainWindow):
             cache_dir=settings.get("cache_dir")
             if isinstance(settings.get("cache_dir"), str)
             else None,
+            sample_image_stats=bool(settings.get("sample_image_stats", False)),
         )
 
         paths = self._config.last_paths or {}
@@ -2346,6 +2384,7 @@ class MainWindow(QMainWindow):
             "follow_symlinks": self._settings.follow_symlinks,
             "use_hash_verification": self._settings.use_hash_verification,
             "cache_dir": self._settings.cache_dir,
+            "sample_image_stats": self._settings.sample_image_stats,
         }
         self._config.filter_options = {
             "show_identical": self._filter_bar.show_identical,
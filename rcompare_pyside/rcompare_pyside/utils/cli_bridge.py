@@ -6,9 +6,40 @@ import json
 import subprocess
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import compress
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Optional
 
+# orjson is optional; it parses the report straight from the CLI's bytes
+# and is several times faster than the json module on large scans.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+# On/off scan options and the rcompare_cli switch each one enables, keyed
+# by the ScanOptions field name.
+SCAN_SWITCHES = (
+    ("follow_symlinks", "--follow-symlinks"),
+    ("verify_hashes", "--verify-hashes"),
+    ("text_diff", "--text-diff"),
+    ("image_diff", "--image-diff"),
+    ("image_exif", "--image-exif"),
+    ("csv_diff", "--csv-diff"),
+    ("excel_diff", "--excel-diff"),
+    ("json_diff", "--json-diff"),
+    ("yaml_diff", "--yaml-diff"),
+    ("parquet_diff", "--parquet-diff"),
+    ("ignore_case", "--ignore-case"),
+)
+# Read all switch fields in one call and keep the flags of the true ones.
+_SWITCH_VALUES = attrgetter(*(name for name, _ in SCAN_SWITCHES))
+_SWITCH_FLAGS = tuple(flag for _, flag in SCAN_SWITCHES)
+
 
 class DiffStatus(str, Enum):
     """Mirror of rcompare_common::DiffStatus."""
@@ -75,6 +106,39 @@ class ImageDiffReport:
     result: dict  # Raw JSON dict of ImageDiffResult
 
 
+@dataclass(frozen=True, slots=True)
+class ScanOptions:
+    """Options for one folder scan (``rcompare_cli scan``)."""
+    left: str
+    right: str
+    follow_symlinks: bool = False
+    verify_hashes: bool = False
+    ignore_patterns: tuple[str, ...] = ()
+    text_diff: bool = False
+    image_diff: bool = False
+    image_exif: bool = False
+    image_tolerance: int = 1
+    csv_diff: bool = False
+    excel_diff: bool = False
+    json_diff: bool = False
+    yaml_diff: bool = False
+    parquet_diff: bool = False
+    ignore_whitespace: Optional[str] = None
+    ignore_case: bool = False
+
+    def cli_args(self) -> list[str]:
+        """Return the rcompare_cli arguments for this scan."""
+        args = ["scan", self.left, self.right, "--json"]
+        args += compress(_SWITCH_FLAGS, _SWITCH_VALUES(self))
+        for pattern in self.ignore_patterns:
+            args += ("--ignore", pattern)
+        if self.image_tolerance != 1:
+            args += ("--image-tolerance", str(self.image_tolerance))
+        if self.ignore_whitespace:
+            args += ("--ignore-whitespace", self.ignore_whitespace)
+        return args
+
+
 @dataclass
 class ScanReport:
     """Complete scan result from CLI JSON output."""
@@ -99,73 +163,26 @@ class CliBridge:
 
     def build_command(self, args: list[str]) -> list[str]:
         """Build a command list for QProcess usage."""
-        return [self._cli_path] + args
-
-    def scan_folders(
-        self,
-        left: str,
-        right: str,
-        ignore_patterns: list[str] | None = None,
-        follow_symlinks: bool = False,
-        verify_hashes: bool = False,
-        text_diff: bool = False,
-        image_diff: bool = False,
-        image_exif: bool = False,
-        image_tolerance: int = 1,
-        csv_diff: bool = False,
-        excel_diff: bool = False,
-        json_diff: bool = False,
-        yaml_diff: bool = False,
-        parquet_diff: bool = False,
-        ignore_whitespace: Optional[str] = None,
-        ignore_case: bool = False,
-    ) -> ScanReport:
-        """Run folder comparison and return parsed JSON result."""
-        cmd = [self._cli_path, "scan", left, right, "--json"]
-        if follow_symlinks:
-            cmd.append("--follow-symlinks")
-        if verify_hashes:
-            cmd.append("--verify-hashes")
-        for pattern in ignore_patterns or []:
-            cmd.extend(["--ignore", pattern])
-        if text_diff:
-            cmd.append("--text-diff")
-        if image_diff:
-            cmd.append("--image-diff")
-        if image_exif:
-            cmd.append("--image-exif")
-        if image_tolerance != 1:
-            cmd.extend(["--image-tolerance", str(image_tolerance)])
-        if csv_diff:
-            cmd.append("--csv-diff")
-        if excel_diff:
-            cmd.append("--excel-diff")
-        if json_diff:
-            cmd.append("--json-diff")
-        if yaml_diff:
-            cmd.append("--yaml-diff")
-        if parquet_diff:
-            cmd.append("--parquet-diff")
-        if ignore_whitespace:
-            cmd.extend(["--ignore-whitespace", ignore_whitespace])
-        if ignore_case:
-            cmd.append("--ignore-case")
+        return [self._cli_path, *args]
 
+    def scan_folders(self, options: ScanOptions) -> ScanReport:
+        """Run folder comparison and return parsed JSON result."""
+        cmd = self.build_command(options.cli_args())
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=600,
+            cmd, capture_output=True, timeout=600,
         )
         # rcompare_cli uses exit code 2 when differences are found.
         if result.returncode not in (0, 2):
-            details = result.stderr.strip() or "no stderr output"
+            details = result.stderr.decode("utf-8", errors="replace").strip() or "no stderr output"
             raise RuntimeError(
                 f"rcompare_cli failed (exit {result.returncode}): {details}"
             )
 
         return self.parse_scan_report(result.stdout)
 
-    def parse_scan_report(self, json_str: str) -> ScanReport:
-        """Parse JSON string into ScanReport."""
-        data = json.loads(json_str)
+    def parse_scan_report(self, json_data: str | bytes | bytearray) -> ScanReport:
+        """Parse JSON text or UTF-8 bytes into ScanReport."""
+        data = orjson.loads(json_data) if _HAS_ORJSON else json.loads(json_data)
         summary = ScanSummary(
             total=data["summary"]["total"],
             same=data["summary"]["same"],
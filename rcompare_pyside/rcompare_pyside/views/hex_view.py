@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Optional
 
 from PySide6.QtCore import (
     QAbstractTableModel,
     QModelIndex,
     Qt,
+    QTimer,
 )
-from PySide6.QtGui import QColor, QFont, QFontDatabase
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QPainter, QPalette
 from PySide6.QtWidgets import (
+    QApplication,
     QFileDialog,
     QHBoxLayout,
     QHeaderView,
     QLabel,
     QPushButton,
     QSplitter,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTableView,
     QVBoxLayout,
     QWidget,
@@ -41,10 +48,115 @@ _DIFF_BG = QColor("#ffe1e1")
 _NORMAL_BG = QColor("#ffffff")
 _NON_PRINTABLE_FG = QColor("#999999")
 
+_SKIP_BLOCK_SIZE = 1024 * 1024  # bytes compared per step when skipping identical regions
+_DIFF_SLICE_SIZE = 16 * 1024 * 1024  # bytes compared per event-loop iteration
+_DIFF_PAGE_SIZE = 4 * 1024  # bytes compared per page before a per-byte scan
+_ROW_CACHE_LIMIT = 4096  # formatted rows kept for painting
 
-def _is_printable(byte: int) -> bool:
-    """Return True if *byte* maps to a printable ASCII character."""
-    return 0x20 <= byte <= 0x7E
+# Lookup tables so the per-cell helpers stay inside C-level bytes methods.
+_HEX_STRINGS: tuple[str, ...] = tuple(f"{b:02X}" for b in range(256))
+_PRINTABLE = bytes(range(0x20, 0x7F))
+_TEXT_BYTES = _PRINTABLE + b"\t\n\r"
+_ASCII_TABLE = bytes(b if 0x20 <= b <= 0x7E else 0x2E for b in range(256))
+
+
+def _ascii_row(chunk: bytes) -> str:
+    """Render *chunk* as ASCII, replacing non-printable bytes with ``.``."""
+    return chunk.translate(_ASCII_TABLE).decode("ascii")
+
+
+def _has_non_printable(chunk: bytes) -> bool:
+    """Return True if *chunk* contains any byte that is not printable text.
+
+    Tabs and line breaks count as text so plain-text rows are not dimmed.
+    """
+    return bool(chunk.translate(None, _TEXT_BYTES))
+
+
+def _is_all_text(data: memoryview) -> bool:
+    """Return True if every byte of *data* is printable text.
+
+    Scans in ``_SKIP_BLOCK_SIZE`` blocks and stops at the first block
+    containing binary data.
+    """
+    for base in range(0, len(data), _SKIP_BLOCK_SIZE):
+        if _has_non_printable(bytes(data[base: base + _SKIP_BLOCK_SIZE])):
+            return False
+    return True
+
+
+def _skip_equal_blocks(left: memoryview, right: memoryview, start: int, end: int) -> int:
+    """Return the first offset in ``[start, end)`` not inside an identical block.
+
+    Both views are compared in ``_SKIP_BLOCK_SIZE`` steps, so the first
+    differing byte lies at or after the returned offset.
+    """
+    base = start
+    while base < end:
+        block_end = min(base + _SKIP_BLOCK_SIZE, end)
+        if left[base:block_end] != right[base:block_end]:
+            break
+        base = block_end
+    return base
+
+
+def _diff_range(left: memoryview, right: memoryview, start: int, end: int) -> list[int]:
+    """Return the ascending positions in ``[start, end)`` where the views differ.
+
+    Identical blocks are skipped first, then the rest is compared in
+    ``_DIFF_PAGE_SIZE`` pages; only pages that are not byte-for-byte equal
+    are scanned individually.
+    """
+    diffs: list[int] = []
+    start = _skip_equal_blocks(left, right, start, end)
+    for base in range(start, end, _DIFF_PAGE_SIZE):
+        page_end = min(base + _DIFF_PAGE_SIZE, end)
+        left_page = left[base:page_end]
+        right_page = right[base:page_end]
+        if left_page == right_page:
+            continue
+        diffs.extend(
+            i for i, (lb, rb) in enumerate(zip(left_page, right_page), base)
+            if lb != rb
+        )
+    return diffs
+
+
+@dataclass
+class _DiffTask:
+    """Progress of a time-sliced comparison between the two hex panels."""
+
+    left: memoryview
+    right: memoryview
+    common: int  # length of the overlapping region
+    position: int  # next byte offset to compare
+
+
+def _is_same_file(left_path: str, right_path: str) -> bool:
+    """Return True if both paths refer to the same file on disk."""
+    try:
+        return os.path.samefile(left_path, right_path)
+    except OSError:
+        return False
+
+
+class _LazyOffsets:
+    """Offset column strings formatted on first access and then cached.
+
+    Only rows that are actually painted get a string, so loading a file
+    costs nothing here regardless of its size.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self) -> None:
+        self._cache: dict[int, str] = {}
+
+    def __getitem__(self, row: int) -> str:
+        text = self._cache.get(row)
+        if text is None:
+            text = self._cache[row] = f"{row * _CHUNK_SIZE:08X}"
+        return text
 
 
 # ---------------------------------------------------------------------------
@@ -68,9 +180,13 @@ class HexTableModel(QAbstractTableModel):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._data: bytes = b""
+        self._data_mv: memoryview = memoryview(self._data)
         self._file_path: str = ""
         self._total_rows: int = 0
         self._loaded_rows: int = 0
+        self._offsets = _LazyOffsets()
+        self._all_text: bool = True
+        self._row_cache: dict[int, tuple[list[str], str, bool]] = {}
         self._diff_indices: set[int] = set()
 
     # ------------------------------------------------------------------
@@ -79,14 +195,30 @@ class HexTableModel(QAbstractTableModel):
 
     def load_file(self, path: str) -> None:
         """Read binary data from *path* and reset the model."""
-        self.beginResetModel()
         try:
             with open(path, "rb") as fh:
-                self._data = fh.read()
+                data = fh.read()
         except OSError:
-            self._data = b""
+            data = b""
+        self._set_data(path, data)
+
+    def share_file(self, path: str, other: HexTableModel) -> None:
+        """Show *path* using the bytes already loaded by *other*.
+
+        Used when both panels point at the same file so it is read (and
+        held in memory) only once.
+        """
+        self._set_data(path, other.raw_data)
+
+    def _set_data(self, path: str, data: bytes) -> None:
+        self.beginResetModel()
+        self._data = data
+        self._data_mv = memoryview(self._data)
         self._file_path = path
         self._total_rows = (len(self._data) + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+        self._offsets = _LazyOffsets()
+        self._all_text = _is_all_text(self._data_mv)
+        self._row_cache = {}
         self._loaded_rows = min(self._total_rows, _INITIAL_LOAD_ROWS)
         self._diff_indices = set()
         self.endResetModel()
@@ -99,10 +231,58 @@ class HexTableModel(QAbstractTableModel):
             bottom_right = self.index(self._loaded_rows - 1, _TOTAL_COLUMNS - 1)
             self.dataChanged.emit(top_left, bottom_right)
 
+    def add_diff_indices(self, indices: Sequence[int]) -> None:
+        """Mark additional differing byte positions.
+
+        *indices* must be in ascending order; only the rows they span are
+        refreshed.
+        """
+        if not indices:
+            return
+        self._diff_indices.update(indices)
+        first_row = indices[0] // _CHUNK_SIZE
+        last_row = min(indices[-1] // _CHUNK_SIZE, self._loaded_rows - 1)
+        if first_row <= last_row:
+            top_left = self.index(first_row, 0)
+            bottom_right = self.index(last_row, _TOTAL_COLUMNS - 1)
+            self.dataChanged.emit(top_left, bottom_right)
+
     @property
     def raw_data(self) -> bytes:
         return self._data
 
+    def row_cells(self, row: int) -> tuple[list[str], str, bool]:
+        """Return the hex strings, ASCII text and dimmed flag for *row*.
+
+        Formatted rows are cached so repeated paints of the same rows do
+        not touch the underlying bytes again.
+        """
+        cached = self._row_cache.get(row)
+        if cached is None:
+            offset = row * _CHUNK_SIZE
+            chunk = bytes(self._data_mv[offset: offset + _CHUNK_SIZE])
+            dimmed = not self._all_text and _has_non_printable(chunk)
+            cached = ([_HEX_STRINGS[b] for b in chunk], _ascii_row(chunk), dimmed)
+            if len(self._row_cache) >= _ROW_CACHE_LIMIT:
+                self._row_cache.clear()
+            self._row_cache[row] = cached
+        return cached
+
+    def cell_paint_data(
+        self, row: int, col: int
+    ) -> tuple[str, Optional[QColor], Optional[QColor]]:
+        """Return ``(text, background, foreground)`` for a cell.
+
+        Used by :class:`HexItemDelegate` to paint without going through
+        :meth:`data` once per role.
+        """
+        offset = row * _CHUNK_SIZE
+        return (
+            self._display_data(row, col, offset) or "",
+            self._background_data(row, col, offset),
+            self._foreground_data(row, col, offset),
+        )
+
     # ------------------------------------------------------------------
     # Lazy loading
     # ------------------------------------------------------------------
@@ -177,19 +357,15 @@ class HexTableModel(QAbstractTableModel):
 
     def _display_data(self, row: int, col: int, offset: int):
         if col == _COL_OFFSET:
-            return f"{offset:08X}"
+            return self._offsets[row]
 
         if _COL_HEX_START <= col <= _COL_HEX_END:
-            byte_index = offset + (col - _COL_HEX_START)
-            if byte_index < len(self._data):
-                return f"{self._data[byte_index]:02X}"
-            return ""
+            cells = self.row_cells(row)[0]
+            cell = col - _COL_HEX_START
+            return cells[cell] if cell < len(cells) else ""
 
         if col == _COL_ASCII:
-            chunk = self._data[offset: offset + _CHUNK_SIZE]
-            return "".join(
-                chr(b) if _is_printable(b) else "." for b in chunk
-            )
+            return self.row_cells(row)[1]
 
         return None
 
@@ -205,7 +381,7 @@ class HexTableModel(QAbstractTableModel):
 
         if col == _COL_ASCII:
             # Highlight the ASCII cell if any byte in the row differs.
-            for i in range(offset, min(offset + _CHUNK_SIZE, len(self._data))):
+            for i in range(offset, min(offset + _CHUNK_SIZE, len(self._data_mv))):
                 if i in self._diff_indices:
                     return _DIFF_BG
             return _NORMAL_BG
@@ -213,15 +389,61 @@ class HexTableModel(QAbstractTableModel):
         return None
 
     def _foreground_data(self, row: int, col: int, offset: int):
-        if col == _COL_ASCII:
-            chunk = self._data[offset: offset + _CHUNK_SIZE]
-            # Use darker text if the chunk contains any non-printable chars.
-            for b in chunk:
-                if not _is_printable(b):
-                    return _NON_PRINTABLE_FG
+        if self._all_text:
+            return None
+        # Use darker text if the chunk contains any non-printable chars.
+        if col == _COL_ASCII and self.row_cells(row)[2]:
+            return _NON_PRINTABLE_FG
         return None
 
 
+# ---------------------------------------------------------------------------
+# HexItemDelegate
+# ---------------------------------------------------------------------------
+
+
+class HexItemDelegate(QStyledItemDelegate):
+    """Paint hex cells directly from :meth:`HexTableModel.cell_paint_data`.
+
+    The default delegate queries :meth:`HexTableModel.data` once per role
+    for every cell, wrapping each result in a QVariant.  This delegate
+    fetches text and colours in a single call and draws them itself.
+    """
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> None:
+        model = index.model()
+        if not isinstance(model, HexTableModel):
+            super().paint(painter, option, index)
+            return
+
+        text, background, foreground = model.cell_paint_data(index.row(), index.column())
+
+        painter.save()
+        if background is not None:
+            painter.fillRect(option.rect, background)
+        painter.setFont(option.font)
+        painter.setPen(
+            foreground if foreground is not None
+            else option.palette.color(QPalette.ColorRole.Text)
+        )
+        # Same text rect and alignment the default delegate uses for a cell
+        # with neither icon nor check box.
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        painter.drawText(
+            option.rect.adjusted(margin, 0, -margin, 0),
+            option.displayAlignment,
+            text,
+        )
+        painter.restore()
+
+
 # ---------------------------------------------------------------------------
 # HexView
 # ---------------------------------------------------------------------------
@@ -241,12 +463,20 @@ class HexView(QWidget):
 
         self._syncing = False
 
+        # Time-sliced diff state ---------------------------------------
+        self._diff_task: Optional[_DiffTask] = None
+        self._diff_timer = QTimer(self)
+        self._diff_timer.setSingleShot(True)
+        self._diff_timer.setInterval(0)
+        self._diff_timer.timeout.connect(self._continue_diff)
+
         # Monospace font used for both tables.
         self._mono_font: QFont = QFontDatabase.systemFont(QFontDatabase.FixedFont)
 
         # Models -------------------------------------------------------
         self._left_model = HexTableModel(self)
         self._right_model = HexTableModel(self)
+        self._delegate = HexItemDelegate(self)
 
         # Path labels --------------------------------------------------
         self._left_path_label = QLabel("(no file loaded)")
@@ -308,9 +538,18 @@ class HexView(QWidget):
     # ------------------------------------------------------------------
 
     def compare_files(self, left_path: str, right_path: str) -> None:
-        """Load two files, compute differences, and display the hex views."""
+        """Load two files, compute differences, and display the hex views.
+
+        Differences are computed in ``_DIFF_SLICE_SIZE`` slices; the first
+        slice runs immediately and the rest are scheduled on the event loop
+        so large files stay scrollable while highlighting fills in.
+        """
+        self._cancel_diff()
         self._left_model.load_file(left_path)
-        self._right_model.load_file(right_path)
+        if _is_same_file(left_path, right_path):
+            self._right_model.share_file(right_path, self._left_model)
+        else:
+            self._right_model.load_file(right_path)
 
         self._left_path_label.setText(os.path.basename(left_path))
         self._left_path_label.setToolTip(left_path)
@@ -320,22 +559,43 @@ class HexView(QWidget):
         # Compute difference indices -----------------------------------
         left_data = self._left_model.raw_data
         right_data = self._right_model.raw_data
-        max_len = max(len(left_data), len(right_data))
+        common = min(len(left_data), len(right_data))
+        self._diff_task = _DiffTask(
+            left=memoryview(left_data),
+            right=memoryview(right_data),
+            common=common,
+            position=common if left_data is right_data else 0,
+        )
+        self._continue_diff()
 
-        diff_left: set[int] = set()
-        diff_right: set[int] = set()
+    # ------------------------------------------------------------------
+    # Time-sliced diff
+    # ------------------------------------------------------------------
 
-        for i in range(max_len):
-            lb = left_data[i] if i < len(left_data) else -1
-            rb = right_data[i] if i < len(right_data) else -1
-            if lb != rb:
-                if i < len(left_data):
-                    diff_left.add(i)
-                if i < len(right_data):
-                    diff_right.add(i)
+    def _continue_diff(self) -> None:
+        """Compare the next slice of the pending diff task."""
+        task = self._diff_task
+        if task is None:
+            return
 
-        self._left_model.set_diff_indices(diff_left)
-        self._right_model.set_diff_indices(diff_right)
+        if task.position < task.common:
+            end = min(task.position + _DIFF_SLICE_SIZE, task.common)
+            diffs = _diff_range(task.left, task.right, task.position, end)
+            task.position = end
+            self._left_model.add_diff_indices(diffs)
+            self._right_model.add_diff_indices(diffs)
+            if task.position < task.common:
+                self._diff_timer.start()
+                return
+
+        # Bytes past the end of the shorter file differ on the longer side.
+        self._left_model.add_diff_indices(range(task.common, len(task.left)))
+        self._right_model.add_diff_indices(range(task.common, len(task.right)))
+        self._diff_task = None
+
+    def _cancel_diff(self) -> None:
+        self._diff_timer.stop()
+        self._diff_task = None
 
     # ------------------------------------------------------------------
     # Table construction
@@ -345,6 +605,7 @@ class HexView(QWidget):
         """Build and configure a QTableView for hex display."""
         table = QTableView(self)
         table.setModel(model)
+        table.setItemDelegate(self._delegate)
         table.setFont(self._mono_font)
         table.setShowGrid(False)
         table.setSelectionMode(QTableView.NoSelection)
@@ -373,6 +634,7 @@ class HexView(QWidget):
             if right_path:
                 self.compare_files(path, right_path)
             else:
+                self._cancel_diff()
                 self._left_model.load_file(path)
                 self._left_path_label.setText(os.path.basename(path))
                 self._left_path_label.setToolTip(path)
@@ -384,6 +646,7 @@ class HexView(QWidget):
             if left_path:
                 self.compare_files(left_path, path)
             else:
+                self._cancel_diff()
                 self._right_model.load_file(path)
                 self._right_path_label.setText(os.path.basename(path))
                 self._right_path_label.setToolTip(path)
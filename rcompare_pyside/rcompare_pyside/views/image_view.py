@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import math
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Optional
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPixmap, QWheelEvent
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+from PySide6.QtGui import QColor, QImage, QPixmap, QPixmapCache, QWheelEvent
 from PySide6.QtWidgets import (
     QFileDialog,
     QGraphicsPixmapItem,
@@ -21,6 +26,24 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+# Pillow and NumPy are only needed for the statistics panel.
+try:
+    import numpy as np  # type: ignore[import-untyped]
+    from PIL import Image, ImageChops  # type: ignore[import-untyped]
+
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+# Numba is optional; when present the diff reductions run as one
+# compiled pass over the diff buffer.
+try:
+    from numba import njit  # type: ignore[import-untyped]
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -29,14 +52,322 @@ _GREEN = QColor("#2e7d32")
 _YELLOW = QColor("#f9a825")
 _RED = QColor("#c62828")
 
+# Indexed by how many of the 95% / 99% thresholds a similarity exceeds.
+_COLORS = (_RED, _YELLOW, _GREEN)
+_SIM_STYLES = tuple(f"color: {c.name()}; font-weight: bold;" for c in _COLORS)
+
+_STATS_CACHE_SIZE = 16  # memoized statistics results
+_SAMPLED_STATS_PIXELS = 4_000_000  # pixels compared when sampling is enabled
+
+# QPixmapCache limit set by the application at startup. Qt's default of
+# 10 MB is smaller than a single 1800x1400 pixmap, so large images would
+# never be cached; 128 MB holds about two decoded 16-megapixel photos.
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
+
+# Extensions handed to the decoder; anything else is rejected up front
+# instead of letting Qt probe every image plugin. The main window uses the
+# same set to route files to this view. Covers the CLI's image types that
+# Qt can decode (all but DDS).
+IMAGE_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".tif",
+    ".webp", ".ico", ".svg", ".pnm", ".pbm", ".pgm", ".ppm", ".tga",
+})
+
+
+def _similarity_level(similarity_pct: float) -> int:
+    """Return the index into :data:`_COLORS` for the similarity percentage."""
+    return (similarity_pct > 95.0) + (similarity_pct > 99.0)
+
 
 def _similarity_color(similarity_pct: float) -> QColor:
     """Return a colour representing the similarity percentage."""
-    if similarity_pct > 99.0:
-        return _GREEN
-    if similarity_pct > 95.0:
-        return _YELLOW
-    return _RED
+    return _COLORS[_similarity_level(similarity_pct)]
+
+
+# ---------------------------------------------------------------------------
+# Statistics computation (uses Pillow, runs on a worker thread)
+# ---------------------------------------------------------------------------
+
+
+# (left file key, right file key) -> stats dict; shared by all views and
+# accessed from pool threads, hence the lock.
+_stats_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_stats_cache_lock = threading.Lock()
+
+
+def _file_key(path: str) -> Optional[tuple[str, int, int]]:
+    """Return ``(path, mtime_ns, size)`` identifying the current file contents."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _pixmap_cache_key(key: tuple[str, int, int]) -> str:
+    """Return the :class:`QPixmapCache` key for a :func:`_file_key` tuple."""
+    return "rcompare-image:{}:{}:{}".format(*key)
+
+
+def _as_rgb(img):
+    """Return *img* in RGB mode, converting only if it is not already RGB."""
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+
+def _open_rgb(path: str):
+    """Decode *path* as an RGB Pillow image."""
+    img = Image.open(path)
+    img.load()  # read the pixels now so the file handle is released
+    return _as_rgb(img)
+
+
+def _reduce_to_scale(img, other_size: tuple[int, int]):
+    """Reduce *img* by an integer factor to the scale of *other_size*.
+
+    Returns *img* unchanged unless it is at least twice as large as
+    *other_size* by the same whole factor in both directions.
+    """
+    ow, oh = other_size
+    if ow <= 0 or oh <= 0:
+        return img
+    factor = min(img.width // ow, img.height // oh)
+    if factor < 2 or img.width // ow != img.height // oh:
+        return img
+    return img.reduce(factor)
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _pixel_stats_kernel(diff):
+        height, width, _ = diff.shape
+        different = 0
+        total = 0
+        for y in range(height):
+            for x in range(width):
+                d0 = int(diff[y, x, 0])
+                d1 = int(diff[y, x, 1])
+                d2 = int(diff[y, x, 2])
+                total += d0 + d1 + d2
+                if d0 | d1 | d2:
+                    different += 1
+        return different, total
+
+
+def _diff_reductions(diff) -> tuple[int, int]:
+    """Return ``(different_pixels, channel_sum)`` for an (H, W, 3) uint8 diff.
+
+    A pixel is "different" if any of its channels differs.
+    """
+    if _HAS_NUMBA:
+        different, total = _pixel_stats_kernel(diff)
+        return int(different), int(total)
+
+    # OR the channels together so the count is a single reduction over
+    # one plane.
+    packed = diff[..., 0].copy()
+    np.bitwise_or(packed, diff[..., 1], out=packed)
+    np.bitwise_or(packed, diff[..., 2], out=packed)
+    return int(np.count_nonzero(packed)), int(diff.sum(dtype=np.uint64))
+
+
+def _image_stats(
+    left_path: str, right_path: str, max_pixels: int = 0
+) -> dict[str, Any]:
+    """Compute pixel-level statistics between two images.
+
+    If *max_pixels* is positive and the compared region is larger, the
+    images are sampled on a regular grid and ``sample_stride`` in the
+    result is greater than 1.
+
+    Returns a dictionary using the same keys as the CLI image report, or
+    a dictionary with a single ``error`` key on failure.  Successful
+    results are memoized on the paths, modification times and sizes of
+    both files.
+    """
+    left_key = _file_key(left_path)
+    right_key = _file_key(right_path)
+    cache_key = (left_key, right_key, max_pixels) if left_key and right_key else None
+    if cache_key is not None:
+        with _stats_cache_lock:
+            cached = _stats_cache.get(cache_key)
+            if cached is not None:
+                _stats_cache.move_to_end(cache_key)
+                return dict(cached)
+
+    stats = _compute_image_stats(left_path, right_path, left_key, right_key, max_pixels)
+
+    if cache_key is not None and "error" not in stats:
+        with _stats_cache_lock:
+            _stats_cache[cache_key] = stats
+            while len(_stats_cache) > _STATS_CACHE_SIZE:
+                _stats_cache.popitem(last=False)
+    return dict(stats)
+
+
+def _compute_image_stats(
+    left_path: str,
+    right_path: str,
+    left_key: Optional[tuple[str, int, int]],
+    right_key: Optional[tuple[str, int, int]],
+    max_pixels: int,
+) -> dict[str, Any]:
+    """Decode both images and compute their statistics (uncached)."""
+    if not _HAS_PIL:
+        return {
+            "error": "Pillow and/or NumPy not installed. "
+            "Install them for pixel statistics: pip install Pillow numpy"
+        }
+
+    if left_key is None or right_key is None:
+        missing = left_path if left_key is None else right_path
+        return {"error": f"Failed to open images for stats: cannot access {missing}"}
+
+    if left_key == right_key:
+        # Self-comparison: identical by definition, only the size is needed.
+        try:
+            with Image.open(left_path) as img:
+                width, height = img.size
+        except Exception as exc:
+            return {"error": f"Failed to open images for stats: {exc}"}
+        return {
+            "left_width": width,
+            "left_height": height,
+            "right_width": width,
+            "right_height": height,
+            "total_pixels": width * height,
+            "different_pixels": 0,
+            "difference_pct": 0.0,
+            "mean_diff": 0.0,
+            "similarity_pct": 100.0,
+            "sample_stride": 1,
+        }
+
+    try:
+        left_img = _open_rgb(left_path)
+        right_img = _open_rgb(right_path)
+    except Exception as exc:
+        return {"error": f"Failed to open images for stats: {exc}"}
+
+    lw, lh = left_img.size
+    rw, rh = right_img.size
+
+    # A larger image that is an integer multiple of the other (e.g. a 2x
+    # export) is box-filtered down to the same scale instead of cropped.
+    left_img = _reduce_to_scale(left_img, right_img.size)
+    right_img = _reduce_to_scale(right_img, left_img.size)
+
+    # To compare, both images must share the same dimensions.
+    # Crop to the overlapping region if sizes differ.
+    cw = min(left_img.width, right_img.width)
+    ch = min(left_img.height, right_img.height)
+    if left_img.size != (cw, ch):
+        left_img = left_img.crop((0, 0, cw, ch))
+    if right_img.size != (cw, ch):
+        right_img = right_img.crop((0, 0, cw, ch))
+
+    # Oversized images are sampled every *stride* pixels in both directions
+    # (nearest-neighbour resize) to bound the work per comparison.
+    stride = 1
+    if max_pixels > 0 and cw * ch > max_pixels:
+        stride = math.ceil(math.sqrt(cw * ch / max_pixels))
+        sampled_size = (-(-cw // stride), -(-ch // stride))
+        left_img = left_img.resize(sampled_size, Image.Resampling.NEAREST)
+        right_img = right_img.resize(sampled_size, Image.Resampling.NEAREST)
+        cw, ch = sampled_size
+
+    # Per-channel absolute difference in a single uint8 pass.
+    diff_img = ImageChops.difference(left_img, right_img)
+    # Drop the decodes and any reduced/cropped/sampled copies before the
+    # reductions run; only the diff is needed from here on.
+    del left_img, right_img
+    diff = np.asarray(diff_img)
+    diff_img.close()
+    del diff_img
+
+    total_pixels = int(cw * ch)
+    different_pixels, total_sum = _diff_reductions(diff)
+    diff_pct = (different_pixels / total_pixels * 100.0) if total_pixels > 0 else 0.0
+    mean_diff = total_sum / diff.size if diff.size else 0.0
+
+    return {
+        "left_width": lw,
+        "left_height": lh,
+        "right_width": rw,
+        "right_height": rh,
+        "total_pixels": total_pixels,
+        "different_pixels": different_pixels,
+        "difference_pct": diff_pct,
+        "mean_diff": mean_diff,
+        "similarity_pct": 100.0 - diff_pct,
+        "sample_stride": stride,
+    }
+
+
+class _StatsSignals(QObject):
+    """Signal carrier for :class:`_StatsJob` (QRunnable is not a QObject)."""
+
+    ready = Signal(int, object)  # request id, stats dict
+
+
+class _StatsJob(QRunnable):
+    """Decode two images and compute their statistics off the GUI thread."""
+
+    def __init__(
+        self,
+        request_id: int,
+        left_path: str,
+        right_path: str,
+        max_pixels: int,
+        signals: _StatsSignals,
+    ) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._left_path = left_path
+        self._right_path = right_path
+        self._max_pixels = max_pixels
+        self._signals = signals
+
+    def run(self) -> None:
+        stats = _image_stats(self._left_path, self._right_path, self._max_pixels)
+        try:
+            self._signals.ready.emit(self._request_id, stats)
+        except RuntimeError:
+            # The view was destroyed while the job was running.
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Image decoding (runs on a worker thread)
+# ---------------------------------------------------------------------------
+
+
+class _PixmapSignals(QObject):
+    """Signal carrier for :class:`_PixmapLoader`."""
+
+    loaded = Signal(str, QImage)  # path, decoded image (null on failure)
+
+
+class _PixmapLoader(QRunnable):
+    """Decode an image file into a :class:`QImage` off the GUI thread.
+
+    Unlike QPixmap, QImage can be used outside the GUI thread; the view
+    converts it to a pixmap once it arrives.
+    """
+
+    def __init__(self, path: str, signals: _PixmapSignals) -> None:
+        super().__init__()
+        self._path = path
+        self._signals = signals
+
+    def run(self) -> None:
+        image = QImage()
+        image.load(self._path)
+        try:
+            self._signals.loaded.emit(self._path, image)
+        except RuntimeError:
+            # The view was destroyed while the image was decoding.
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +422,9 @@ class ImageView(QWidget):
         self._left_scene = QGraphicsScene(self)
         self._left_view = ZoomableGraphicsView(self)
         self._left_view.setScene(self._left_scene)
+        # One pixmap item per scene, updated in place on every load.
+        self._left_pixmap_item = QGraphicsPixmapItem()
+        self._left_scene.addItem(self._left_pixmap_item)
 
         left_header = QHBoxLayout()
         left_header.addWidget(self._left_path_label, stretch=1)
@@ -113,6 +447,8 @@ class ImageView(QWidget):
         self._right_scene = QGraphicsScene(self)
         self._right_view = ZoomableGraphicsView(self)
         self._right_view.setScene(self._right_scene)
+        self._right_pixmap_item = QGraphicsPixmapItem()
+        self._right_scene.addItem(self._right_pixmap_item)
 
         right_header = QHBoxLayout()
         right_header.addWidget(self._right_path_label, stretch=1)
@@ -175,6 +511,21 @@ class ImageView(QWidget):
         # Internal state -----------------------------------------------
         self._left_path: str = ""
         self._right_path: str = ""
+        self._stats_request: int = 0
+        self._max_stats_pixels: int = 0  # exact unless sampling is enabled
+        self._stats_signals = _StatsSignals(self)
+        self._stats_signals.ready.connect(self._on_stats_ready)
+        self._panels: dict[str, tuple[QGraphicsScene, QGraphicsPixmapItem, QLabel]] = {
+            "left": (self._left_scene, self._left_pixmap_item, self._left_path_label),
+            "right": (self._right_scene, self._right_pixmap_item, self._right_path_label),
+        }
+        # side -> (path being decoded, whether compare_images asked for it)
+        self._pending_images: dict[str, tuple[str, bool]] = {}
+        self._load_errors: dict[str, str] = {}  # side -> error of the current compare
+        # side -> (path, mtime_ns, size) of the image currently shown
+        self._loaded_images: dict[str, Optional[tuple[str, int, int]]] = {}
+        self._pixmap_signals = _PixmapSignals(self)
+        self._pixmap_signals.loaded.connect(self._on_image_loaded)
 
     # ------------------------------------------------------------------
     # Public API
@@ -182,25 +533,35 @@ class ImageView(QWidget):
 
     def compare_images(self, left_path: str, right_path: str) -> None:
         """Load two images, display them, and compute pixel statistics."""
+        self._stats_request += 1  # supersede any statistics still running
         self._error_label.setVisible(False)
+        self._load_errors = {}
         self._left_path = left_path
         self._right_path = right_path
 
-        left_ok = self._load_image(left_path, self._left_scene, self._left_path_label)
-        right_ok = self._load_image(right_path, self._right_scene, self._right_path_label)
+        left_ok = self._load_image("left", left_path, compare=True)
+        right_ok = self._load_image("right", right_path, compare=True)
 
         if not left_ok or not right_ok:
-            problems: list[str] = []
             if not left_ok:
-                problems.append(f"Cannot read left image: {left_path}")
+                self._load_errors["left"] = f"Cannot read left image: {left_path}"
             if not right_ok:
-                problems.append(f"Cannot read right image: {right_path}")
-            self._show_error("; ".join(problems))
+                self._load_errors["right"] = f"Cannot read right image: {right_path}"
+            self._show_load_errors()
             self._clear_stats()
             return
 
         self._compute_stats(left_path, right_path)
 
+    def set_stats_sampling(self, enabled: bool) -> None:
+        """Enable or disable sampling for large image statistics.
+
+        When enabled, images whose compared region exceeds the pixel budget
+        are sampled on a regular grid and the total-pixels label is marked
+        as sampled. Statistics are exact by default.
+        """
+        self._max_stats_pixels = _SAMPLED_STATS_PIXELS if enabled else 0
+
     def load_from_cli_report(self, report_dict: dict[str, Any]) -> None:
         """Populate the view from a CLI JSON report dictionary.
 
@@ -209,16 +570,18 @@ class ImageView(QWidget):
             right_width, right_height, total_pixels, different_pixels,
             difference_pct, mean_diff, similarity_pct
         """
+        self._stats_request += 1  # supersede any statistics still running
         self._error_label.setVisible(False)
+        self._load_errors = {}
 
         left_path = report_dict.get("left_path", "")
         right_path = report_dict.get("right_path", "")
 
         if left_path:
-            self._load_image(left_path, self._left_scene, self._left_path_label)
+            self._load_image("left", left_path)
             self._left_path = left_path
         if right_path:
-            self._load_image(right_path, self._right_scene, self._right_path_label)
+            self._load_image("right", right_path)
             self._right_path = right_path
 
         lw = report_dict.get("left_width", "?")
@@ -226,146 +589,224 @@ class ImageView(QWidget):
         rw = report_dict.get("right_width", "?")
         rh = report_dict.get("right_height", "?")
 
-        self._lbl_left_dims.setText(f"Left: {lw} x {lh}")
-        self._lbl_right_dims.setText(f"Right: {rw} x {rh}")
-        self._lbl_total_pixels.setText(
-            f"Total pixels: {report_dict.get('total_pixels', '-')}"
-        )
-        self._lbl_diff_pixels.setText(
-            f"Different pixels: {report_dict.get('different_pixels', '-')}"
-        )
-        diff_pct = report_dict.get("difference_pct")
-        self._lbl_diff_pct.setText(
-            f"Difference: {diff_pct:.2f}%" if diff_pct is not None else "Difference: -"
-        )
-        mean_diff = report_dict.get("mean_diff")
-        self._lbl_mean_diff.setText(
-            f"Mean diff: {mean_diff:.2f}" if mean_diff is not None else "Mean diff: -"
-        )
-        similarity_pct = report_dict.get("similarity_pct")
-        if similarity_pct is not None:
-            self._set_similarity(similarity_pct)
-        else:
-            self._lbl_similarity.setText("Similarity: -")
+        with self._batched_stats_update():
+            self._lbl_left_dims.setText(f"Left: {lw} x {lh}")
+            self._lbl_right_dims.setText(f"Right: {rw} x {rh}")
+            self._lbl_total_pixels.setText(
+                f"Total pixels: {report_dict.get('total_pixels', '-')}"
+            )
+            self._lbl_diff_pixels.setText(
+                f"Different pixels: {report_dict.get('different_pixels', '-')}"
+            )
+            diff_pct = report_dict.get("difference_pct")
+            self._lbl_diff_pct.setText(
+                f"Difference: {diff_pct:.2f}%" if diff_pct is not None else "Difference: -"
+            )
+            mean_diff = report_dict.get("mean_diff")
+            self._lbl_mean_diff.setText(
+                f"Mean diff: {mean_diff:.2f}" if mean_diff is not None else "Mean diff: -"
+            )
+            similarity_pct = report_dict.get("similarity_pct")
+            if similarity_pct is not None:
+                self._set_similarity(similarity_pct)
+            else:
+                self._lbl_similarity.setText("Similarity: -")
 
     # ------------------------------------------------------------------
     # Image loading
     # ------------------------------------------------------------------
 
-    def _load_image(
-        self,
-        path: str,
-        scene: QGraphicsScene,
-        label: QLabel,
-    ) -> bool:
-        """Load an image into *scene* and update *label*.
+    def _load_image(self, side: str, path: str, compare: bool = False) -> bool:
+        """Start loading *path* into the *side* (``"left"``/``"right"``) panel.
 
-        Returns True on success, False otherwise.
+        The file is decoded on the global thread pool and shown by
+        :meth:`_on_image_loaded`.  Returns False if *path* is not a file
+        or does not have a supported image extension.  With *compare*, a
+        failed decode is reported as an error and clears the statistics.
         """
-        scene.clear()
+        _, item, label = self._panels[side]
         if not path or not os.path.isfile(path):
+            item.setPixmap(QPixmap())
+            self._pending_images.pop(side, None)
+            self._loaded_images.pop(side, None)
             label.setText("(no image loaded)")
             label.setToolTip("")
             return False
 
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            label.setText("(unreadable image)")
+        if os.path.splitext(path)[1].lower() not in IMAGE_EXTENSIONS:
+            item.setPixmap(QPixmap())
+            self._pending_images.pop(side, None)
+            self._loaded_images.pop(side, None)
+            label.setText("(unsupported)")
             label.setToolTip(path)
             return False
 
-        scene.addItem(QGraphicsPixmapItem(pixmap))
-        scene.setSceneRect(pixmap.rect().toRectF())
+        key = _file_key(path)
+        if key is not None and self._loaded_images.get(side) == key:
+            # Same unchanged file is already displayed.
+            self._pending_images.pop(side, None)
+            label.setText(os.path.basename(path))
+            label.setToolTip(path)
+            return True
+
+        item.setPixmap(QPixmap())
+        self._loaded_images.pop(side, None)
         label.setText(os.path.basename(path))
         label.setToolTip(path)
-        return True
-
-    # ------------------------------------------------------------------
-    # Statistics computation (uses Pillow)
-    # ------------------------------------------------------------------
 
-    def _compute_stats(self, left_path: str, right_path: str) -> None:
-        """Compute pixel-level statistics between two images via Pillow."""
-        try:
-            from PIL import Image  # type: ignore[import-untyped]
-            import numpy as np  # type: ignore[import-untyped]
-        except ImportError:
-            self._show_error(
-                "Pillow and/or NumPy not installed. "
-                "Install them for pixel statistics: pip install Pillow numpy"
+        # Both panels showing the same file share one decoded pixmap.
+        cached = QPixmapCache.find(_pixmap_cache_key(key)) if key else None
+        if cached is not None and not cached.isNull():
+            self._pending_images.pop(side, None)
+            self._show_pixmap(side, path, cached)
+            return True
+
+        already_pending = any(p == path for p, _ in self._pending_images.values())
+        self._pending_images[side] = (path, compare)
+        if not already_pending:
+            QThreadPool.globalInstance().start(
+                _PixmapLoader(path, self._pixmap_signals)
             )
-            self._clear_stats()
-            return
+        return True
 
-        try:
-            left_img = Image.open(left_path).convert("RGB")
-            right_img = Image.open(right_path).convert("RGB")
-        except Exception as exc:
-            self._show_error(f"Failed to open images for stats: {exc}")
-            self._clear_stats()
+    def _on_image_loaded(self, path: str, image: QImage) -> None:
+        """Show an image decoded by :class:`_PixmapLoader` in every panel
+        still waiting for *path*."""
+        sides = [s for s, (p, _) in self._pending_images.items() if p == path]
+        if not sides:
+            return  # superseded by a newer load
+        compare_sides = [s for s in sides if self._pending_images.pop(s)[1]]
+
+        if image.isNull():
+            for side in sides:
+                self._panels[side][2].setText("(unreadable image)")
+            # Statistics from a CLI report stay; only a compare loses them.
+            if compare_sides:
+                self._stats_request += 1  # statistics cannot succeed either
+                for side in compare_sides:
+                    self._load_errors[side] = f"Cannot read {side} image: {path}"
+                self._show_load_errors()
+                self._clear_stats()
             return
 
-        lw, lh = left_img.size
-        rw, rh = right_img.size
+        # QPixmap may only be created on the GUI thread.
+        pixmap = QPixmap.fromImage(image)
+        key = _file_key(path)
+        if key is not None:
+            QPixmapCache.insert(_pixmap_cache_key(key), pixmap)
+        for side in sides:
+            self._show_pixmap(side, path, pixmap)
+
+    def _show_pixmap(self, side: str, path: str, pixmap: QPixmap) -> None:
+        scene, item, _ = self._panels[side]
+        item.setPixmap(pixmap)
+        scene.setSceneRect(pixmap.rect().toRectF())
+        self._loaded_images[side] = _file_key(path)
 
-        self._lbl_left_dims.setText(f"Left: {lw} x {lh}")
-        self._lbl_right_dims.setText(f"Right: {rw} x {rh}")
+    # ------------------------------------------------------------------
+    # Statistics computation
+    # ------------------------------------------------------------------
 
-        # To compare, both images must share the same dimensions.
-        # Crop to the overlapping region if sizes differ.
-        cw = min(lw, rw)
-        ch = min(lh, rh)
+    def _compute_stats(self, left_path: str, right_path: str) -> None:
+        """Compute pixel-level statistics on the global thread pool.
 
-        left_arr = np.asarray(left_img.crop((0, 0, cw, ch)), dtype=np.int16)
-        right_arr = np.asarray(right_img.crop((0, 0, cw, ch)), dtype=np.int16)
+        Results arrive in :meth:`_on_stats_ready`; results of a superseded
+        request are discarded.
+        """
+        job = _StatsJob(
+            self._stats_request,
+            left_path,
+            right_path,
+            self._max_stats_pixels,
+            self._stats_signals,
+        )
+        QThreadPool.globalInstance().start(job)
 
-        diff = np.abs(left_arr - right_arr)
+    def _on_stats_ready(self, request_id: int, stats: dict[str, Any]) -> None:
+        """Update the statistics labels from a finished :class:`_StatsJob`."""
+        if request_id != self._stats_request:
+            return
 
-        # A pixel is "different" if any channel differs.
-        pixel_diffs = np.any(diff > 0, axis=2)
-        total_pixels = int(cw * ch)
-        different_pixels = int(np.sum(pixel_diffs))
-        diff_pct = (different_pixels / total_pixels * 100.0) if total_pixels > 0 else 0.0
-        mean_diff = float(np.mean(diff))
-        similarity_pct = 100.0 - diff_pct
+        error = stats.get("error")
+        if error:
+            self._show_error(error)
+            self._clear_stats()
+            return
 
-        self._lbl_total_pixels.setText(f"Total pixels: {total_pixels:,}")
-        self._lbl_diff_pixels.setText(f"Different pixels: {different_pixels:,}")
-        self._lbl_diff_pct.setText(f"Difference: {diff_pct:.2f}%")
-        self._lbl_mean_diff.setText(f"Mean diff: {mean_diff:.2f}")
-        self._set_similarity(similarity_pct)
+        with self._batched_stats_update():
+            self._lbl_left_dims.setText(
+                f"Left: {stats['left_width']} x {stats['left_height']}"
+            )
+            self._lbl_right_dims.setText(
+                f"Right: {stats['right_width']} x {stats['right_height']}"
+            )
+            total_text = f"Total pixels: {stats['total_pixels']:,}"
+            stride = stats.get("sample_stride", 1)
+            if stride > 1:
+                total_text += f" (sampled 1/{stride * stride})"
+            self._lbl_total_pixels.setText(total_text)
+            self._lbl_diff_pixels.setText(
+                f"Different pixels: {stats['different_pixels']:,}"
+            )
+            self._lbl_diff_pct.setText(f"Difference: {stats['difference_pct']:.2f}%")
+            self._lbl_mean_diff.setText(f"Mean diff: {stats['mean_diff']:.2f}")
+            self._set_similarity(stats["similarity_pct"])
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def _batched_stats_update(self) -> Iterator[None]:
+        """Suspend repaints of the statistics panel while its labels change.
+
+        The panel is repainted once when the block exits instead of once
+        per ``setText`` call.
+        """
+        self._stats_box.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._stats_box.setUpdatesEnabled(True)
+            self._stats_box.update()
+
     def _set_similarity(self, similarity_pct: float) -> None:
         """Update the similarity label with colour-coded text."""
-        colour = _similarity_color(similarity_pct)
         self._lbl_similarity.setText(f"Similarity: {similarity_pct:.2f}%")
-        self._lbl_similarity.setStyleSheet(f"color: {colour.name()}; font-weight: bold;")
+        self._lbl_similarity.setStyleSheet(_SIM_STYLES[_similarity_level(similarity_pct)])
 
     def _clear_stats(self) -> None:
         """Reset all statistics labels to their default state."""
-        self._lbl_left_dims.setText("Left: -")
-        self._lbl_right_dims.setText("Right: -")
-        self._lbl_total_pixels.setText("Total pixels: -")
-        self._lbl_diff_pixels.setText("Different pixels: -")
-        self._lbl_diff_pct.setText("Difference: -")
-        self._lbl_mean_diff.setText("Mean diff: -")
-        self._lbl_similarity.setText("Similarity: -")
-        self._lbl_similarity.setStyleSheet("")
+        with self._batched_stats_update():
+            self._lbl_left_dims.setText("Left: -")
+            self._lbl_right_dims.setText("Right: -")
+            self._lbl_total_pixels.setText("Total pixels: -")
+            self._lbl_diff_pixels.setText("Different pixels: -")
+            self._lbl_diff_pct.setText("Difference: -")
+            self._lbl_mean_diff.setText("Mean diff: -")
+            self._lbl_similarity.setText("Similarity: -")
+            self._lbl_similarity.setStyleSheet("")
 
     def _show_error(self, message: str) -> None:
         """Display an error message above the image panels."""
         self._error_label.setText(message)
         self._error_label.setVisible(True)
 
+    def _show_load_errors(self) -> None:
+        """Display the load errors of the current compare, left side first."""
+        self._show_error(
+            "; ".join(self._load_errors[s] for s in self._panels if s in self._load_errors)
+        )
+
     # ------------------------------------------------------------------
     # Browse helpers
     # ------------------------------------------------------------------
 
-    _IMAGE_FILTER = "Images (*.png *.jpg *.jpeg *.bmp *.gif *.tiff *.webp);;All Files (*)"
+    _IMAGE_FILTER = (
+        "Images ("
+        + " ".join(f"*{ext}" for ext in sorted(IMAGE_EXTENSIONS))
+        + ");;All Files (*)"
+    )
 
     def _browse_left(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -375,7 +816,7 @@ class ImageView(QWidget):
             if self._right_path:
                 self.compare_images(path, self._right_path)
             else:
-                self._load_image(path, self._left_scene, self._left_path_label)
+                self._load_image("left", path)
                 self._left_path = path
 
     def _browse_right(self) -> None:
@@ -386,5 +827,5 @@ class ImageView(QWidget):
             if self._left_path:
                 self.compare_images(self._left_path, path)
             else:
-                self._load_image(path, self._right_scene, self._right_path_label)
+                self._load_image("right", path)
                 self._right_path = path
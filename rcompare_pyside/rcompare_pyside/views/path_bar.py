@@ -1,7 +1,7 @@
 """PathBar widget for left/right (and optional base) path selection."""
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QDragEnterEvent, QDropEvent, QPalette
+from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QFileDialog,
     QGridLayout,
@@ -16,6 +16,15 @@ COLOR_LEFT = "#5a9ed8"
 COLOR_RIGHT = "#d85a6a"
 COLOR_BASE = "#4caf50"
 
+_INDICATOR_STYLE = (
+    "background-color: {color}; color: #ffffff; border-radius: 3px;"
+    " font-weight: bold; padding: 2px 6px;"
+)
+_INDICATOR_STYLES = {
+    color: _INDICATOR_STYLE.format(color=color)
+    for color in (COLOR_LEFT, COLOR_RIGHT, COLOR_BASE)
+}
+
 ARCHIVE_FILTER = (
     "Archives (*.zip *.tar *.tar.gz *.tar.bz2 *.tar.xz *.7z);;All Files (*)"
 )
@@ -51,15 +60,9 @@ def _make_indicator(text: str, color: str) -> QLabel:
     label = QLabel(text)
     label.setFixedWidth(50)
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    label.setAutoFillBackground(True)
-    palette = label.palette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(color))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor("#ffffff"))
-    label.setPalette(palette)
-    label.setStyleSheet(
-        f"background-color: {color}; color: #ffffff; border-radius: 3px;"
-        " font-weight: bold; padding: 2px 6px;"
-    )
+    # The style sheet paints the background, so no palette is needed.
+    style = _INDICATOR_STYLES.get(color) or _INDICATOR_STYLE.format(color=color)
+    label.setStyleSheet(style)
     return label
 
 
@@ -123,23 +126,17 @@ class PathBar(QWidget):
         # --- Connections ---
 
         # Left
-        self._left_edit.editingFinished.connect(
-            lambda: self.left_path_changed.emit(self._left_edit.text())
-        )
+        self._left_edit.editingFinished.connect(self._emit_left_path)
         self._left_browse_folder.clicked.connect(self._browse_left_folder)
         self._left_browse_archive.clicked.connect(self._browse_left_archive)
 
         # Right
-        self._right_edit.editingFinished.connect(
-            lambda: self.right_path_changed.emit(self._right_edit.text())
-        )
+        self._right_edit.editingFinished.connect(self._emit_right_path)
         self._right_browse_folder.clicked.connect(self._browse_right_folder)
         self._right_browse_archive.clicked.connect(self._browse_right_archive)
 
         # Base
-        self._base_edit.editingFinished.connect(
-            lambda: self.base_path_changed.emit(self._base_edit.text())
-        )
+        self._base_edit.editingFinished.connect(self._emit_base_path)
         self._base_browse_folder.clicked.connect(self._browse_base_folder)
         self._base_browse_archive.clicked.connect(self._browse_base_archive)
 
@@ -189,6 +186,19 @@ class PathBar(QWidget):
         self._base_edit.setText(value)
         self.base_path_changed.emit(value)
 
+    # ------------------------------------------------------------------
+    # Edit handlers
+    # ------------------------------------------------------------------
+
+    def _emit_left_path(self) -> None:
+        self.left_path_changed.emit(self._left_edit.text())
+
+    def _emit_right_path(self) -> None:
+        self.right_path_changed.emit(self._right_edit.text())
+
+    def _emit_base_path(self) -> None:
+        self.base_path_changed.emit(self._base_edit.text())
+
     # ------------------------------------------------------------------
     # Browse helpers
     # ------------------------------------------------------------------
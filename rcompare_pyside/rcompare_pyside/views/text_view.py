@@ -2,25 +2,210 @@
 
 from __future__ import annotations
 
+import difflib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import groupby, repeat
+from operator import attrgetter
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QLabel, QPushButton,
     QFileDialog,
 )
 
-from ..widgets.diff_text_edit import DiffTextEdit
+from ..widgets.diff_text_edit import DiffSide, DiffTextEdit
 from ..utils.cli_bridge import CliBridge, TextDiffReport, TextDiffLine
 
-
 # Colors for diff lines
 COLOR_EQUAL = QColor("#ffffff")
 COLOR_INSERT = QColor("#e8f4ea")  # Light green - added on right
 COLOR_DELETE = QColor("#ffe1e1")  # Light red - deleted from left
 COLOR_GAP = QColor("#f5f5f5")    # Gray for gap lines
 
+# Per-line colors are passed to DiffTextEdit as indices into this palette
+PAL_EQUAL = 0
+PAL_INSERT = 1
+PAL_DELETE = 2
+PAL_GAP = 3
+_PALETTE = (COLOR_EQUAL, COLOR_INSERT, COLOR_DELETE, COLOR_GAP)
+
+# CLI report change type -> (left color, right color, on left, on right)
+_CLI_CHANGE_ROWS = {
+    "Equal": (PAL_EQUAL, PAL_EQUAL, True, True),
+    "Delete": (PAL_DELETE, PAL_GAP, True, False),
+    "Insert": (PAL_GAP, PAL_INSERT, False, True),
+}
+
+_LINES_CACHE_SIZE = 8  # files kept split
+_OPCODES_CACHE_SIZE = 8  # file pairs whose diff is kept
+
+# Diffs run on pool threads; this lock guards the three tables below. It is
+# held only to look entries up and store them, never while a file is read
+# or diffed, so one slow comparison does not stall the others.
+_cache_lock = threading.Lock()
+# (path, mtime_ns, size) -> lines
+_lines_cache: OrderedDict[tuple[str, int, int], list[str]] = OrderedDict()
+# (left file key, right file key) -> opcodes
+_opcodes_cache: OrderedDict[tuple, list[tuple[str, int, int, int, int]]] = OrderedDict()
+# left file key -> (difflib matcher holding that file's line ids as seq2,
+# line -> id table of that file), so the left file's index is reused
+# while only the right-hand file changes
+_matcher_cache: dict[tuple[str, int, int], tuple[difflib.SequenceMatcher, dict[str, int]]] = {}
+
+
+def _load_lines(path: str) -> tuple[tuple[str, int, int], list[str]]:
+    """Return the file key and lines of *path*.
+
+    Results are cached on the file's path, mtime and size, so comparing
+    an unchanged file again skips reading and splitting it.
+    Raises OSError if the file cannot be read.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        lines = _lines_cache.get(key)
+        if lines is not None:
+            _lines_cache.move_to_end(key)
+            return key, lines
+
+    # One binary read and one decode; no TextIOWrapper chunking.
+    # splitlines() already handles \r\n, so newline translation is not needed.
+    lines = Path(path).read_bytes().decode("utf-8", errors="replace").splitlines()
+
+    with _cache_lock:
+        _lines_cache[key] = lines
+        if len(_lines_cache) > _LINES_CACHE_SIZE:
+            _lines_cache.popitem(last=False)
+    return key, lines
+
+
+_SWAPPED_TAGS = {"equal": "equal", "replace": "replace", "delete": "insert", "insert": "delete"}
+
+
+def _difflib_opcodes(
+    left_key: tuple[str, int, int], left_lines: list[str], right_lines: list[str]
+) -> list[tuple[str, int, int, int, int]]:
+    """Diff with difflib, reusing the left file's index across right files.
+
+    SequenceMatcher only indexes its second sequence, so the left file is
+    passed as seq2 and the resulting opcodes are mirrored back. Lines are
+    matched as int ids numbered per left file; right-hand lines that do
+    not occur on the left all map to -1, which never matches.
+    """
+    # The matcher is taken out of the cache while in use, so a concurrent
+    # diff against the same left file builds its own instead of sharing it.
+    with _cache_lock:
+        cached = _matcher_cache.pop(left_key, None)
+    if cached is None:
+        line_ids: dict[str, int] = {}
+        left_ids = [line_ids.setdefault(line, len(line_ids)) for line in left_lines]
+        cached = (difflib.SequenceMatcher(None, [], left_ids), line_ids)
+    matcher, line_ids = cached
+    matcher.set_seq1(list(map(line_ids.get, right_lines, repeat(-1))))
+    opcodes = [
+        (_SWAPPED_TAGS[tag], j1, j2, i1, i2)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+    ]
+    with _cache_lock:
+        _matcher_cache.clear()
+        _matcher_cache[left_key] = cached
+    return opcodes
+
+
+def _diff_rows(left_path: str, right_path: str) -> tuple[DiffSide, DiffSide]:
+    """Diff two text files into left and right display rows.
+
+    Colors are :data:`_PALETTE` indices.  Raises OSError if either file
+    cannot be read.
+    """
+    left_key, left_lines = _load_lines(left_path)
+    right_key, right_lines = _load_lines(right_path)
+
+    pair = (left_key, right_key)
+    with _cache_lock:
+        opcodes = _opcodes_cache.get(pair)
+        if opcodes is not None:
+            _opcodes_cache.move_to_end(pair)
+    if opcodes is None:
+        opcodes = _difflib_opcodes(left_key, left_lines, right_lines)
+        with _cache_lock:
+            _opcodes_cache[pair] = opcodes
+            if len(_opcodes_cache) > _OPCODES_CACHE_SIZE:
+                _opcodes_cache.popitem(last=False)
+
+    # Both sides get one row per aligned line; the total is known up front,
+    # so the columns are allocated once, pre-filled with gap text and the
+    # "equal" color, and only the real lines and change colors are written.
+    total = sum(
+        i2 - i1 if tag == "equal" else max(i2 - i1, j2 - j1)
+        for tag, i1, i2, j1, j2 in opcodes
+    )
+    left = DiffSide([""] * total, array("B", bytes([PAL_EQUAL])) * total, [""] * total)
+    right = DiffSide([""] * total, array("B", bytes([PAL_EQUAL])) * total, [""] * total)
+    display_left, colors_left, nums_left = left.lines, left.colors, left.nums
+    display_right, colors_right, nums_right = right.lines, right.colors, right.nums
+
+    insert = array("B", [PAL_INSERT])
+    delete = array("B", [PAL_DELETE])
+    gap = array("B", [PAL_GAP])
+    row = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        n_left = i2 - i1
+        n_right = j2 - j1
+        display_left[row:row + n_left] = left_lines[i1:i2]
+        nums_left[row:row + n_left] = map(str, range(i1 + 1, i2 + 1))
+        display_right[row:row + n_right] = right_lines[j1:j2]
+        nums_right[row:row + n_right] = map(str, range(j1 + 1, j2 + 1))
+        if tag == "equal":
+            row += n_left
+            continue
+
+        # delete/insert/replace: changed lines on each side, padded
+        # with gap rows up to the longer of the two ranges.
+        rows = max(n_left, n_right)
+        colors_left[row:row + n_left] = delete * n_left
+        colors_left[row + n_left:row + rows] = gap * (rows - n_left)
+        colors_right[row:row + n_right] = insert * n_right
+        colors_right[row + n_right:row + rows] = gap * (rows - n_right)
+        row += rows
+
+    return left, right
+
+
+class _DiffSignals(QObject):
+    """Signal carrier for :class:`_DiffJob` (QRunnable is not a QObject)."""
+
+    finished = Signal(int, object)  # request id, (left, right) DiffSides or error message
+
+
+class _DiffJob(QRunnable):
+    """Read and diff two text files off the GUI thread."""
+
+    def __init__(
+        self, request_id: int, left_path: str, right_path: str, signals: _DiffSignals
+    ) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._left_path = left_path
+        self._right_path = right_path
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result: object = _diff_rows(self._left_path, self._right_path)
+        except OSError as e:
+            result = f"Error reading file: {e}"
+        try:
+            self._signals.finished.emit(self._request_id, result)
+        except RuntimeError:
+            # The view was destroyed while the diff was running.
+            pass
+
 
 class TextView(QWidget):
     """Side-by-side text diff view with synchronized scrolling."""
@@ -28,6 +213,16 @@ class TextView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._syncing = False
+        # Latest (side, value) scroll waiting to be mirrored to the other editor
+        self._pending_sync: tuple[str, int] | None = None
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._apply_pending_sync)
+        # Bumped per comparison so results of superseded diffs are dropped
+        self._diff_request = 0
+        self._diff_signals = _DiffSignals(self)
+        self._diff_signals.finished.connect(self._on_diff_ready)
         self._left_path = ""
         self._right_path = ""
 
@@ -80,147 +275,110 @@ class TextView(QWidget):
     def _on_left_scroll(self, value: int) -> None:
         if self._syncing:
             return
-        self._syncing = True
-        left_max = self._left_editor.verticalScrollBar().maximum()
-        right_max = self._right_editor.verticalScrollBar().maximum()
-        if left_max > 0:
-            ratio = value / left_max
-            self._right_editor.verticalScrollBar().setValue(int(ratio * right_max))
-        else:
-            self._right_editor.verticalScrollBar().setValue(value)
-        self._syncing = False
+        self._pending_sync = ("left", value)
+        self._sync_timer.start()
 
     def _on_right_scroll(self, value: int) -> None:
         if self._syncing:
             return
+        self._pending_sync = ("right", value)
+        self._sync_timer.start()
+
+    def _apply_pending_sync(self) -> None:
+        """Mirror the latest scroll position; bursts of ticks collapse into one."""
+        if self._pending_sync is None:
+            return
+        side, value = self._pending_sync
+        self._pending_sync = None
+        if side == "left":
+            source, target = self._left_editor, self._right_editor
+        else:
+            source, target = self._right_editor, self._left_editor
         self._syncing = True
-        left_max = self._left_editor.verticalScrollBar().maximum()
-        right_max = self._right_editor.verticalScrollBar().maximum()
-        if right_max > 0:
-            ratio = value / right_max
-            self._left_editor.verticalScrollBar().setValue(int(ratio * left_max))
+        source_max = source.verticalScrollBar().maximum()
+        target_max = target.verticalScrollBar().maximum()
+        if source_max > 0:
+            ratio = value / source_max
+            target.verticalScrollBar().setValue(int(ratio * target_max))
         else:
-            self._left_editor.verticalScrollBar().setValue(value)
+            target.verticalScrollBar().setValue(value)
         self._syncing = False
 
     def compare_files(self, left_path: str, right_path: str) -> None:
-        """Compare two text files using Python difflib."""
-        import difflib
+        """Compare two text files line by line.
 
+        Reading and diffing run on the global thread pool; the editors are
+        filled by :meth:`_on_diff_ready` when the result arrives.
+        """
         self._left_path = left_path
         self._right_path = right_path
         self._left_path_label.setText(left_path)
         self._right_path_label.setText(right_path)
 
-        try:
-            left_text = Path(left_path).read_text(errors="replace")
-            right_text = Path(right_path).read_text(errors="replace")
-        except OSError as e:
-            self._left_editor.setPlainText(f"Error reading file: {e}")
-            return
+        self._diff_request += 1
+        QThreadPool.globalInstance().start(
+            _DiffJob(self._diff_request, left_path, right_path, self._diff_signals)
+        )
 
-        left_lines = left_text.splitlines()
-        right_lines = right_text.splitlines()
-
-        # Generate side-by-side diff
-        matcher = difflib.SequenceMatcher(None, left_lines, right_lines)
-
-        display_left: list[str] = []
-        display_right: list[str] = []
-        colors_left: list[QColor] = []
-        colors_right: list[QColor] = []
-        nums_left: list[str] = []
-        nums_right: list[str] = []
-
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == "equal":
-                for i, j in zip(range(i1, i2), range(j1, j2)):
-                    display_left.append(left_lines[i])
-                    display_right.append(right_lines[j])
-                    colors_left.append(COLOR_EQUAL)
-                    colors_right.append(COLOR_EQUAL)
-                    nums_left.append(str(i + 1))
-                    nums_right.append(str(j + 1))
-            elif tag == "replace":
-                max_len = max(i2 - i1, j2 - j1)
-                for k in range(max_len):
-                    if i1 + k < i2:
-                        display_left.append(left_lines[i1 + k])
-                        colors_left.append(COLOR_DELETE)
-                        nums_left.append(str(i1 + k + 1))
-                    else:
-                        display_left.append("")
-                        colors_left.append(COLOR_GAP)
-                        nums_left.append("")
-                    if j1 + k < j2:
-                        display_right.append(right_lines[j1 + k])
-                        colors_right.append(COLOR_INSERT)
-                        nums_right.append(str(j1 + k + 1))
-                    else:
-                        display_right.append("")
-                        colors_right.append(COLOR_GAP)
-                        nums_right.append("")
-            elif tag == "delete":
-                for i in range(i1, i2):
-                    display_left.append(left_lines[i])
-                    display_right.append("")
-                    colors_left.append(COLOR_DELETE)
-                    colors_right.append(COLOR_GAP)
-                    nums_left.append(str(i + 1))
-                    nums_right.append("")
-            elif tag == "insert":
-                for j in range(j1, j2):
-                    display_left.append("")
-                    display_right.append(right_lines[j])
-                    colors_left.append(COLOR_GAP)
-                    colors_right.append(COLOR_INSERT)
-                    nums_left.append("")
-                    nums_right.append(str(j + 1))
-
-        self._left_editor.set_content(display_left, colors_left, nums_left)
-        self._right_editor.set_content(display_right, colors_right, nums_right)
+    def _on_diff_ready(self, request_id: int, result: object) -> None:
+        """Show rows computed by :class:`_DiffJob` unless superseded."""
+        if request_id != self._diff_request:
+            return
+        if isinstance(result, str):
+            self._left_editor.clear_content()
+            self._left_editor.setPlainText(result)
+            return
+        left, right = result
+        self._left_editor.set_content(left, _PALETTE)
+        self._right_editor.set_content(right, _PALETTE)
 
     def load_from_cli_report(self, report: TextDiffReport, left_root: str, right_root: str) -> None:
         """Load text diff from CLI JSON output."""
+        self._diff_request += 1  # supersede any diff still running
         self._left_path = str(Path(left_root) / report.path)
         self._right_path = str(Path(right_root) / report.path)
         self._left_path_label.setText(self._left_path)
         self._right_path_label.setText(self._right_path)
 
-        display_left: list[str] = []
-        display_right: list[str] = []
-        colors_left: list[QColor] = []
-        colors_right: list[QColor] = []
-        nums_left: list[str] = []
-        nums_right: list[str] = []
-
-        for line in report.lines:
-            if line.change_type == "Equal":
-                display_left.append(line.content)
-                display_right.append(line.content)
-                colors_left.append(COLOR_EQUAL)
-                colors_right.append(COLOR_EQUAL)
-                nums_left.append(str(line.line_number_left) if line.line_number_left else "")
-                nums_right.append(str(line.line_number_right) if line.line_number_right else "")
-            elif line.change_type == "Delete":
-                display_left.append(line.content)
-                display_right.append("")
-                colors_left.append(COLOR_DELETE)
-                colors_right.append(COLOR_GAP)
-                nums_left.append(str(line.line_number_left) if line.line_number_left else "")
-                nums_right.append("")
-            elif line.change_type == "Insert":
-                display_left.append("")
-                display_right.append(line.content)
-                colors_left.append(COLOR_GAP)
-                colors_right.append(COLOR_INSERT)
-                nums_left.append("")
-                nums_right.append(str(line.line_number_right) if line.line_number_right else "")
-
-        self._left_editor.set_content(display_left, colors_left, nums_left)
-        self._right_editor.set_content(display_right, colors_right, nums_right)
+        left = DiffSide()
+        right = DiffSide()
+        display_left, colors_left, nums_left = left.lines, left.colors, left.nums
+        display_right, colors_right, nums_right = right.lines, right.colors, right.nums
+
+        # Runs of lines with the same change type are appended in bulk.
+        for change_type, run in groupby(report.lines, key=attrgetter("change_type")):
+            row = _CLI_CHANGE_ROWS.get(change_type)
+            if row is None:
+                continue
+            left_color, right_color, on_left, on_right = row
+            lines = list(run)
+            n = len(lines)
+            if on_left:
+                display_left.extend([line.content for line in lines])
+                nums_left.extend([
+                    str(line.line_number_left) if line.line_number_left else ""
+                    for line in lines
+                ])
+            else:
+                display_left.extend(repeat("", n))
+                nums_left.extend(repeat("", n))
+            if on_right:
+                display_right.extend([line.content for line in lines])
+                nums_right.extend([
+                    str(line.line_number_right) if line.line_number_right else ""
+                    for line in lines
+                ])
+            else:
+                display_right.extend(repeat("", n))
+                nums_right.extend(repeat("", n))
+            colors_left.extend(repeat(left_color, n))
+            colors_right.extend(repeat(right_color, n))
+
+        self._left_editor.set_content(left, _PALETTE)
+        self._right_editor.set_content(right, _PALETTE)
 
     def clear_content(self) -> None:
+        self._diff_request += 1  # supersede any diff still running
         self._left_editor.clear_content()
         self._right_editor.clear_content()
         self._left_path_label.setText("Left file")
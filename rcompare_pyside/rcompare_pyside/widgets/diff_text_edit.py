@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QRect, QSize, Signal
-from PySide6.QtGui import QColor, QPainter, QTextFormat, QPaintEvent, QResizeEvent, QTextOption
-from PySide6.QtWidgets import QPlainTextEdit, QWidget, QTextEdit
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import groupby
+
+from PySide6.QtCore import Qt, QEvent, QPoint, QRect, QSize, Signal
+from PySide6.QtGui import (
+    QColor, QPainter, QTextFormat, QPaintEvent, QResizeEvent, QTextOption,
+    QTextBlockFormat, QTextCursor, QTextDocument,
+)
+from PySide6.QtWidgets import QPlainTextDocumentLayout, QPlainTextEdit, QWidget, QTextEdit
+
+
+@dataclass
+class DiffSide:
+    """One side of a side-by-side diff, stored column-wise."""
+
+    lines: list[str] = field(default_factory=list)
+    colors: array = field(default_factory=lambda: array("B"))  # palette index per line
+    nums: list[str] = field(default_factory=list)  # display line numbers ("" for gaps)
 
 
 class LineNumberArea(QWidget):
@@ -34,42 +51,135 @@ class DiffTextEdit(QPlainTextEdit):
         self.setReadOnly(True)
         self.setWordWrapMode(QTextOption.WrapMode.NoWrap)
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Read-only: keep line background formatting off the undo stack.
+        self.document().setUndoRedoEnabled(False)
 
         self._line_number_area = LineNumberArea(self)
-        self._line_colors: list[QColor] = []
+        # Per-line background as an index into _line_palette
+        self._line_colors: Sequence[int] = array("B")
+        self._line_palette: tuple[QColor, ...] = ()
         self._line_numbers: list[str] = []  # Custom line numbers (can be empty for gaps)
+        self._number_digits = 0  # widest custom line number
+        self._gutter_width = 0  # cached line_number_area_width()
+        self._digit_width = self.fontMetrics().horizontalAdvance("9")
+        self._content: tuple[DiffSide, tuple[QColor, ...]] | None = None  # last set_content
 
-        self.blockCountChanged.connect(self._update_line_number_area_width)
+        self.blockCountChanged.connect(self._on_block_count_changed)
         self.updateRequest.connect(self._update_line_number_area)
 
         self.verticalScrollBar().valueChanged.connect(self.scroll_value_changed.emit)
 
-        self._update_line_number_area_width(0)
-
-    def set_content(self, lines: list[str], colors: list[QColor], line_numbers: list[str]) -> None:
-        """Set the diff content with per-line colors and custom line numbers."""
-        self._line_colors = colors
-        self._line_numbers = line_numbers
-        self.setPlainText("\n".join(lines))
+        self._on_block_count_changed(0)
+
+    def set_content(self, side: DiffSide, palette: Sequence[QColor]) -> None:
+        """Set the diff content with per-line colors and custom line numbers.
+
+        ``side.colors`` holds one index into *palette* per line. Content
+        equal to what is already shown is not rebuilt.
+        """
+        palette = tuple(palette)
+        if self._content == (side, palette):
+            self.viewport().update()
+            return
+        self._content = (side, palette)
+        self._line_colors = side.colors
+        self._line_palette = palette
+        self._line_numbers = side.nums
+        # Measured once here; the gutter width is read on every scroll.
+        self._number_digits = max(map(len, side.nums), default=0)
+        # Build and color the new document before it is attached, so the
+        # editor lays it out once and never shows it half-formatted.
+        doc = self._new_document()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        cursor.insertText("\n".join(side.lines))
+        cursor.endEditBlock()
+        self._apply_line_backgrounds(doc)
+        # setDocument only deletes the editor's original document; ones
+        # made by _new_document are children of the editor and would live
+        # as long as it does.
+        old_doc = self.document()
+        if old_doc.parent() is not self:
+            old_doc = None
+        self.setDocument(doc)
+        if old_doc is not None:
+            old_doc.deleteLater()
+        # Digits may change even when the block count does not.
+        self._on_block_count_changed(self.blockCount())
         self.viewport().update()
 
+    def _new_document(self) -> QTextDocument:
+        """Return an empty document configured like the current one."""
+        current = self.document()
+        doc = QTextDocument(self)
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        # Read-only: keep line background formatting off the undo stack.
+        doc.setUndoRedoEnabled(False)
+        doc.setDefaultFont(current.defaultFont())
+        doc.setDefaultTextOption(current.defaultTextOption())
+        doc.setDocumentMargin(current.documentMargin())
+        return doc
+
+    def _apply_line_backgrounds(self, doc: QTextDocument) -> None:
+        """Store line colors as block backgrounds of *doc*.
+
+        QPlainTextEdit paints block backgrounds in the same pass as the
+        text, so no separate walk over the visible blocks is needed.
+        Consecutive lines of one color share a single format change.
+        """
+        painted = self._painted_palette()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        start = 0
+        for slot, run in groupby(self._line_colors[:doc.blockCount()]):
+            end = start + sum(1 for _ in run)
+            if painted[slot]:
+                fmt = QTextBlockFormat()
+                fmt.setBackground(self._line_palette[slot])
+                cursor.setPosition(doc.findBlockByNumber(start).position())
+                cursor.setPosition(
+                    doc.findBlockByNumber(end - 1).position(), QTextCursor.MoveMode.KeepAnchor
+                )
+                cursor.setBlockFormat(fmt)
+            start = end
+        cursor.endEditBlock()
+
+    def _painted_palette(self) -> list[bool]:
+        """Return, per palette entry, whether lines of that color get a background."""
+        # Compare against palette base color instead of hardcoded white
+        base = self.palette().color(self.palette().ColorRole.Base)
+        return [color.isValid() and color != base for color in self._line_palette]
+
     def clear_content(self) -> None:
         """Clear all content."""
-        self._line_colors = []
+        self._content = None
+        self._line_colors = array("B")
+        self._line_palette = ()
         self._line_numbers = []
+        self._number_digits = 0
         self.clear()
 
     def line_number_area_width(self) -> int:
+        return self._gutter_width
+
+    def _compute_gutter_width(self) -> None:
         digits = max(1, len(str(self.blockCount())))
         # Also consider custom line numbers width
-        if self._line_numbers:
-            max_num = max((len(n) for n in self._line_numbers if n), default=digits)
-            digits = max(digits, max_num)
-        space = 10 + self.fontMetrics().horizontalAdvance("9") * digits
-        return space
+        digits = max(digits, self._number_digits)
+        self._gutter_width = 10 + self._digit_width * digits
+
+    def _on_block_count_changed(self, _: int) -> None:
+        self._compute_gutter_width()
+        self._update_line_number_area_width(0)
 
     def _update_line_number_area_width(self, _: int) -> None:
-        self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
+        self.setViewportMargins(self._gutter_width, 0, 0, 0)
+
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._digit_width = self.fontMetrics().horizontalAdvance("9")
+            self._on_block_count_changed(self.blockCount())
 
     def _update_line_number_area(self, rect: QRect, dy: int) -> None:
         if dy:
@@ -89,75 +199,54 @@ class DiffTextEdit(QPlainTextEdit):
     def paint_line_numbers(self, event: QPaintEvent) -> None:
         """Paint line numbers in the gutter area."""
         painter = QPainter(self._line_number_area)
+        # Palette colors are looked up once per paint, not once per block.
+        palette = self.palette()
         # Use palette color instead of hardcoded #f0f0f0
-        painter.fillRect(event.rect(), self.palette().color(self.palette().ColorRole.AlternateBase))
-
-        block = self.firstVisibleBlock()
+        painter.fillRect(event.rect(), palette.color(palette.ColorRole.AlternateBase))
+        painted = self._painted_palette()
+        line_palette = self._line_palette
+        # Use palette color instead of hardcoded #808080
+        painter.setPen(palette.color(palette.ColorRole.Dark))
+        width = self._line_number_area.width()
+        text_width = width - 4
+        align = Qt.AlignRight | Qt.AlignVCenter
+        line_colors = self._line_colors
+        line_numbers = self._line_numbers
+        n_colors = len(line_colors)
+        n_numbers = len(line_numbers)
+
+        # Start at the first block inside the dirty rect rather than the
+        # first visible one; the gutter shares the viewport's y coordinates.
+        dirty = event.rect()
+        block = self.cursorForPosition(QPoint(0, dirty.top())).block()
         block_number = block.blockNumber()
         top = round(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-        bottom = top + round(self.blockBoundingRect(block).height())
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
+        # Unwrapped monospace text: every block has the same height.
+        line_h = round(self.blockBoundingRect(block).height())
+        bottom = top + line_h
+        dirty_top = dirty.top()
+        dirty_bottom = dirty.bottom()
+
+        while block.isValid() and top <= dirty_bottom:
+            if block.isVisible() and bottom >= dirty_top:
                 # Draw line background color if we have one
-                if block_number < len(self._line_colors):
-                    bg = self._line_colors[block_number]
-                    # Compare against palette base color instead of hardcoded white
-                    if bg.isValid() and bg != self.palette().color(self.palette().ColorRole.Base):
-                        painter.fillRect(
-                            0, top,
-                            self._line_number_area.width(),
-                            round(self.blockBoundingRect(block).height()),
-                            bg,
-                        )
+                if block_number < n_colors:
+                    slot = line_colors[block_number]
+                    if painted[slot]:
+                        painter.fillRect(0, top, width, line_h, line_palette[slot])
 
                 # Draw line number
-                if block_number < len(self._line_numbers):
-                    number = self._line_numbers[block_number]
+                if block_number < n_numbers:
+                    number = line_numbers[block_number]
                 else:
                     number = str(block_number + 1)
 
                 if number:
-                    # Use palette color instead of hardcoded #808080
-                    painter.setPen(self.palette().color(self.palette().ColorRole.Dark))
-                    painter.drawText(
-                        0, top,
-                        self._line_number_area.width() - 4,
-                        round(self.blockBoundingRect(block).height()),
-                        Qt.AlignRight | Qt.AlignVCenter,
-                        number,
-                    )
+                    painter.drawText(0, top, text_width, line_h, align, number)
 
             block = block.next()
             top = bottom
-            bottom = top + round(self.blockBoundingRect(block).height())
+            bottom = top + line_h
             block_number += 1
 
         painter.end()
-
-    def paintEvent(self, event: QPaintEvent) -> None:
-        """Paint line backgrounds before the text."""
-        # Paint line background colors on the viewport
-        painter = QPainter(self.viewport())
-        block = self.firstVisibleBlock()
-        block_number = block.blockNumber()
-        top = round(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible():
-                height = round(self.blockBoundingRect(block).height())
-                if block_number < len(self._line_colors):
-                    bg = self._line_colors[block_number]
-                    # Compare against palette base color instead of hardcoded white
-                    if bg.isValid() and bg != self.palette().color(self.palette().ColorRole.Base):
-                        painter.fillRect(
-                            0, top, self.viewport().width(), height, bg
-                        )
-                block_number += 1
-                top += height
-            block = block.next()
-
-        painter.end()
-
-        # Now paint the text on top
-        super().paintEvent(event)
@@ -1,6 +1,6 @@
 """FilterBar widget providing toggle buttons and a search field for result filtering."""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QFrame,
@@ -19,9 +19,12 @@ COLOR_LEFT_ONLY = "#5b85dd"
 COLOR_RIGHT_ONLY = "#d85a6a"
 COLOR_FILES_ONLY = "#6d96d6"
 
+# Typing in the search field re-filters once this long after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
+
 # KDE Compliance: Simplified button style using palette colors where possible
 _BUTTON_STYLE_TEMPLATE = """
-QToolButton {{
+QToolButton[colorRole="{role}"] {{
     border: 1px solid palette(mid);
     border-radius: 3px;
     padding: 2px 8px;
@@ -29,33 +32,46 @@ QToolButton {{
     background-color: palette(button);
     color: palette(button-text);
 }}
-QToolButton:checked {{
+QToolButton[colorRole="{role}"]:checked {{
     border: 2px solid {color};
     background-color: {color_bg};
     color: palette(bright-text);
     font-weight: bold;
 }}
-QToolButton:hover {{
+QToolButton[colorRole="{role}"]:hover {{
     background-color: palette(light);
 }}
-QToolButton:checked:hover {{
+QToolButton[colorRole="{role}"]:checked:hover {{
     background-color: {color};
 }}
 """
 
+# Toggle color role -> indicator color
+_ROLE_COLORS = {
+    "identical": COLOR_IDENTICAL,
+    "different": COLOR_DIFFERENT,
+    "left_only": COLOR_LEFT_ONLY,
+    "right_only": COLOR_RIGHT_ONLY,
+    "files_only": COLOR_FILES_ONLY,
+}
+
+# One style sheet for every toggle, set on the FilterBar and matched on each
+# button's colorRole property. A lighter background for the checked-but-not-
+# hovered state is derived via RGBA hex shorthand (~80 % opacity).
+FILTER_BAR_QSS = "".join(
+    _BUTTON_STYLE_TEMPLATE.format(role=role, color=color, color_bg=color + "cc")
+    for role, color in _ROLE_COLORS.items()
+)
+
 
-def _make_toggle(text: str, color: str, *, checked: bool = True) -> QToolButton:
-    """Create a compact, checkable QToolButton with a colored checked state."""
+def _make_toggle(text: str, role: str, *, checked: bool = True) -> QToolButton:
+    """Create a compact, checkable QToolButton styled by its color *role*."""
     btn = QToolButton()
     btn.setText(text)
     btn.setCheckable(True)
     btn.setChecked(checked)
     btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-    # Derive a lighter background for the checked-but-not-hovered state
-    color_bg = color + "cc"  # ~80 % opacity via RGBA hex shorthand
-    btn.setStyleSheet(
-        _BUTTON_STYLE_TEMPLATE.format(color=color, color_bg=color_bg)
-    )
+    btn.setProperty("colorRole", role)
     return btn
 
 
@@ -74,11 +90,12 @@ class FilterBar(QWidget):
         layout.setSpacing(4)
 
         # --- Toggle buttons ---
-        self._btn_identical = _make_toggle("Identical", COLOR_IDENTICAL)
-        self._btn_different = _make_toggle("Different", COLOR_DIFFERENT)
-        self._btn_left_only = _make_toggle("Left Only", COLOR_LEFT_ONLY)
-        self._btn_right_only = _make_toggle("Right Only", COLOR_RIGHT_ONLY)
-        self._btn_files_only = _make_toggle("Files Only", COLOR_FILES_ONLY, checked=False)
+        self.setStyleSheet(FILTER_BAR_QSS)
+        self._btn_identical = _make_toggle("Identical", "identical")
+        self._btn_different = _make_toggle("Different", "different")
+        self._btn_left_only = _make_toggle("Left Only", "left_only")
+        self._btn_right_only = _make_toggle("Right Only", "right_only")
+        self._btn_files_only = _make_toggle("Files Only", "files_only", checked=False)
 
         layout.addWidget(self._btn_identical)
         layout.addWidget(self._btn_different)
@@ -130,13 +147,18 @@ class FilterBar(QWidget):
         self._search_edit.setClearButtonEnabled(True)
         layout.addWidget(self._search_edit, 1)  # stretch factor 1
 
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._emit_filters_changed)
+
         # --- Connections ---
         self._btn_identical.toggled.connect(self._emit_filters_changed)
         self._btn_different.toggled.connect(self._emit_filters_changed)
         self._btn_left_only.toggled.connect(self._emit_filters_changed)
         self._btn_right_only.toggled.connect(self._emit_filters_changed)
         self._btn_files_only.toggled.connect(self._emit_filters_changed)
-        self._search_edit.textChanged.connect(self._emit_filters_changed)
+        self._search_edit.textChanged.connect(self._search_timer.start)
         self._diff_options.currentIndexChanged.connect(self._on_diff_option_changed)
 
     # ------------------------------------------------------------------
@@ -144,6 +166,8 @@ class FilterBar(QWidget):
     # ------------------------------------------------------------------
 
     def _emit_filters_changed(self) -> None:
+        # The current search text is included, so a pending debounce is moot.
+        self._search_timer.stop()
         self.filters_changed.emit(
             self._btn_identical.isChecked(),
             self._btn_different.isChecked(),
@@ -153,6 +177,44 @@ class FilterBar(QWidget):
             self._search_edit.text(),
         )
 
+    def set_filters(
+        self,
+        identical: bool,
+        different: bool,
+        left_only: bool,
+        right_only: bool,
+        files_only: bool | None = None,
+        search: str | None = None,
+    ) -> None:
+        """Set several filters at once, emitting ``filters_changed`` at most once.
+
+        *files_only* and *search* are left unchanged when ``None``.
+        """
+        states = [
+            (self._btn_identical, identical),
+            (self._btn_different, different),
+            (self._btn_left_only, left_only),
+            (self._btn_right_only, right_only),
+        ]
+        if files_only is not None:
+            states.append((self._btn_files_only, files_only))
+
+        changed = False
+        for btn, checked in states:
+            if btn.isChecked() != checked:
+                btn.blockSignals(True)
+                btn.setChecked(checked)
+                btn.blockSignals(False)
+                changed = True
+        if search is not None and search != self._search_edit.text():
+            self._search_edit.blockSignals(True)
+            self._search_edit.setText(search)
+            self._search_edit.blockSignals(False)
+            changed = True
+
+        if changed:
+            self._emit_filters_changed()
+
     def _on_diff_option_changed(self) -> None:
         self.diff_option_changed.emit(self.diff_option_mode)
 
@@ -2,8 +2,51 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, QProcess, Signal
-from ..utils.cli_bridge import CliBridge, ScanReport
+import sys
+
+from PySide6.QtCore import QIODevice, QObject, QProcess, QRunnable, QThreadPool, QTimer, Signal
+from ..utils.cli_bridge import CliBridge, ScanOptions, ScanReport
+
+# Stderr is drained at most this often while the CLI writes to it; each
+# drain forwards only the latest progress line, so the ones in between are
+# dropped.
+PROGRESS_INTERVAL_MS = 50
+
+# Only the tail of stderr is kept for error messages, so a runaway CLI
+# cannot grow the buffer without bound.
+STDERR_TAIL_BYTES = 64 * 1024
+
+
+class _ParseSignals(QObject):
+    """Signal carrier for :class:`_ParseJob` (QRunnable is not a QObject)."""
+
+    finished = Signal(int, object)  # scan id, ScanReport or error message
+
+
+class _ParseJob(QRunnable):
+    """Parse a CLI scan report off the GUI thread."""
+
+    def __init__(
+        self, scan_id: int, cli_bridge: CliBridge, data: bytearray, signals: _ParseSignals
+    ) -> None:
+        super().__init__()
+        self._scan_id = scan_id
+        self._cli_bridge = cli_bridge
+        self._data = data
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            result: object = self._cli_bridge.parse_scan_report(self._data)
+        except Exception as e:
+            result = f"Failed to parse results: {e}"
+        # Release the raw report before listeners build views from it.
+        self._data = None
+        try:
+            self._signals.finished.emit(self._scan_id, result)
+        except RuntimeError:
+            # The worker was destroyed while the report was being parsed.
+            pass
 
 
 class ComparisonWorker(QObject):
@@ -16,80 +59,78 @@ class ComparisonWorker(QObject):
     def __init__(self, cli_bridge: CliBridge, parent=None):
         super().__init__(parent)
         self._cli_bridge = cli_bridge
-        self._process = QProcess(self)
-        self._stderr_buffer = ""
-        self._process.finished.connect(self._on_finished)
-        self._process.readyReadStandardError.connect(self._on_stderr)
-
-    def start_scan(
-        self,
-        left: str,
-        right: str,
-        follow_symlinks: bool = False,
-        verify_hashes: bool = False,
-        ignore_patterns: list[str] | None = None,
-        text_diff: bool = False,
-        image_diff: bool = False,
-        image_exif: bool = False,
-        image_tolerance: int = 1,
-        csv_diff: bool = False,
-        excel_diff: bool = False,
-        json_diff: bool = False,
-        yaml_diff: bool = False,
-        parquet_diff: bool = False,
-        ignore_whitespace: str | None = None,
-        ignore_case: bool = False,
-    ) -> None:
+        self._process: QProcess | None = None  # created by the first scan
+        self._stdout_buffer = bytearray()
+        self._stderr_buffer = bytearray()
+        self._stderr_line_start = 0  # offset of the unfinished stderr line
+        self._stderr_timer = QTimer(self)
+        self._stderr_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._stderr_timer.setSingleShot(True)
+        self._stderr_timer.timeout.connect(self._drain_stderr)
+        self._scan_id = 0  # bumped per scan; stale parse results are dropped
+        self._parsing = False
+        self._parse_signals = _ParseSignals(self)
+        self._parse_signals.finished.connect(self._on_parsed)
+
+    def _ensure_process(self) -> QProcess:
+        """Return the worker's QProcess, creating it on first use.
+
+        The same process object (and its signal connections) is reused for
+        every later scan of this worker.
+        """
+        if self._process is None:
+            self._process = QProcess(self)
+            self._process.finished.connect(self._on_finished)
+            # The report is drained as it arrives so it never piles up in
+            # QProcess's read buffer and is not copied out in one piece at exit.
+            # stderr stays a separate channel: with --json the CLI writes only
+            # warnings and errors there, and merging it would corrupt the report.
+            self._process.readyReadStandardOutput.connect(self._on_stdout)
+            # stderr output arms a single-shot timer instead of being handled
+            # per readyRead, so a chatty CLI costs one drain per interval and
+            # a quiet one costs nothing.
+            self._process.readyReadStandardError.connect(self._schedule_stderr_drain)
+            # The CLI reads nothing from stdin; give it the null device
+            # rather than an idle pipe.
+            self._process.setStandardInputFile(QProcess.nullDevice())
+            if sys.platform != "win32":
+                # Spawn without copying the GUI's page tables; nothing runs
+                # in the child before exec, so vfork is safe here.
+                self._process.setUnixProcessParameters(QProcess.UnixProcessFlag.UseVFork)
+        return self._process
+
+    def start_scan(self, options: ScanOptions) -> None:
         """Start an async folder scan."""
-        args = ["scan", left, right, "--json"]
-        if follow_symlinks:
-            args.append("--follow-symlinks")
-        if verify_hashes:
-            args.append("--verify-hashes")
-        for p in ignore_patterns or []:
-            args.extend(["--ignore", p])
-        if text_diff:
-            args.append("--text-diff")
-        if image_diff:
-            args.append("--image-diff")
-        if image_exif:
-            args.append("--image-exif")
-        if image_tolerance != 1:
-            args.extend(["--image-tolerance", str(image_tolerance)])
-        if csv_diff:
-            args.append("--csv-diff")
-        if excel_diff:
-            args.append("--excel-diff")
-        if json_diff:
-            args.append("--json-diff")
-        if yaml_diff:
-            args.append("--yaml-diff")
-        if parquet_diff:
-            args.append("--parquet-diff")
-        if ignore_whitespace:
-            args.extend(["--ignore-whitespace", ignore_whitespace])
-        if ignore_case:
-            args.append("--ignore-case")
-
-        cmd = self._cli_bridge.build_command(args)
-        self._stderr_buffer = ""
+        cmd = self._cli_bridge.build_command(options.cli_args())
+        process = self._ensure_process()
+        self._scan_id += 1
+        self._parsing = False
+        self._stdout_buffer = bytearray()
+        self._stderr_buffer = bytearray()
+        self._stderr_line_start = 0
         self.progress.emit("Starting comparison...")
-        self._process.start(cmd[0], cmd[1:])
+        # Read-only and without QIODevice.Text: output is taken as raw bytes,
+        # with no newline translation pass over the report on Windows.
+        process.start(cmd[0], cmd[1:], QIODevice.OpenModeFlag.ReadOnly)
 
     def cancel(self) -> None:
         """Cancel a running comparison."""
-        if self._process.state() != QProcess.NotRunning:
+        self._scan_id += 1  # drop a report that is still being parsed
+        self._parsing = False
+        if self._process is not None and self._process.state() != QProcess.NotRunning:
             self._process.kill()
 
     def is_running(self) -> bool:
-        return self._process.state() != QProcess.NotRunning
+        return self._parsing or (
+            self._process is not None and self._process.state() != QProcess.NotRunning
+        )
 
     def _on_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
-        stdout = self._process.readAllStandardOutput().data().decode("utf-8", errors="replace")
-        stderr_tail = self._process.readAllStandardError().data().decode("utf-8", errors="replace")
-        if stderr_tail:
-            self._stderr_buffer += stderr_tail
-        stderr = self._stderr_buffer.strip()
+        self._stderr_timer.stop()
+        self._drain_stderr()
+        self._on_stdout()
+        stdout = self._stdout_buffer
+        self._stdout_buffer = bytearray()
 
         if exit_status == QProcess.CrashExit:
             self.error.emit("Comparison process crashed")
@@ -99,20 +140,60 @@ class ComparisonWorker(QObject):
         #   0 => no differences found
         #   2 => differences found (successful comparison)
         if exit_code not in (0, 2):
+            # stderr is only decoded for the error message; a successful
+            # scan never looks at it.
+            stderr = self._stderr_buffer.decode("utf-8", errors="replace").strip()
             details = stderr or "no stderr output"
             self.error.emit(f"Comparison failed (exit {exit_code}): {details}")
             return
 
-        try:
-            report = self._cli_bridge.parse_scan_report(stdout)
-            self.finished.emit(report)
-        except Exception as e:
-            self.error.emit(f"Failed to parse results: {e}")
+        # Large reports take seconds to parse; keep that off the GUI thread.
+        self._parsing = True
+        QThreadPool.globalInstance().start(
+            _ParseJob(self._scan_id, self._cli_bridge, stdout, self._parse_signals)
+        )
 
-    def _on_stderr(self) -> None:
-        data = self._process.readAllStandardError().data().decode("utf-8", errors="replace")
-        if not data:
+    def _on_parsed(self, scan_id: int, result: object) -> None:
+        """Deliver a report parsed by :class:`_ParseJob` unless superseded."""
+        if scan_id != self._scan_id:
+            return
+        self._parsing = False
+        if isinstance(result, str):
+            self.error.emit(result)
+            return
+        self.finished.emit(result)
+
+    def _on_stdout(self) -> None:
+        # memoryview appends straight from the QByteArray; .data() would
+        # first copy each chunk into a temporary bytes object.
+        self._stdout_buffer += memoryview(self._process.readAllStandardOutput())
+
+    def _schedule_stderr_drain(self) -> None:
+        # Restarting an active timer would postpone the drain for as long
+        # as the CLI keeps writing.
+        if not self._stderr_timer.isActive():
+            self._stderr_timer.start()
+
+    def _drain_stderr(self) -> None:
+        chunk = self._process.readAllStandardError()
+        if chunk.isEmpty():
+            return
+        buffer = self._stderr_buffer
+        buffer += memoryview(chunk)
+        excess = len(buffer) - STDERR_TAIL_BYTES
+        if excess > STDERR_TAIL_BYTES:  # trim in batches, not on every chunk
+            cut = buffer.find(b"\n", excess) + 1 or excess
+            del buffer[:cut]
+            self._stderr_line_start = max(0, self._stderr_line_start - cut)
+        # Only lines completed by this chunk are looked at, and of those only
+        # the last non-blank one is decoded; a partial line waits for the rest.
+        end = buffer.rfind(b"\n", self._stderr_line_start)
+        if end < 0:
+            return
+        lines = buffer[self._stderr_line_start:end].rstrip()
+        self._stderr_line_start = end + 1
+        if not lines:
             return
-        self._stderr_buffer += data
-        for line in data.strip().splitlines():
-            self.progress.emit(line.strip())
+        line = lines[lines.rfind(b"\n") + 1:].strip()
+        if line:
+            self.progress.emit(line.decode("utf-8", errors="replace"))